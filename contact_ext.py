@@ -1,88 +1,314 @@
 pdf_path = r"E:\Jyaba\legaldatamanagerpdfservice\temp_individual_pdfs\Complaint4.pdf"
 
-from typing import Dict, Optional, List
-from difflib import SequenceMatcher
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator, Sequence, Tuple
+from contextlib import closing
+import copy
+import mmap
 import pdfplumber
-from difflib import SequenceMatcher
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream, resolve1
+from rapidfuzz import fuzz, process
+from functools import lru_cache
+import os
+import re
 
-def extract_plaintiff_contact_with_layout(pdf_path: str) -> Optional[List[Dict]]:
+# Deletion table for the punctuation stripped by normalize_text
+_PUNCT_TABLE = str.maketrans('', '', '.,;:!?()[]{}"\'\\-_')
+
+# clean_contact drops lines containing a remove term and stops at a cutoff term.
+# Both are scanned over the whole lowered buffer and mapped back to line numbers.
+_REMOVE_TERMS = frozenset({
+    'hereby', 'demands', 'jury', 'trial', 'issues', 'triable', 'respectfully', 'submitted', 'this'
+})
+_CUTOFF_TERMS = frozenset({
+    'attorneys for plaintiff', 'benefits', 'explanation', 'patient', 'transaction', 'history', 'charges'
+})
+_REMOVE_RE = re.compile('|'.join(map(re.escape, sorted(_REMOVE_TERMS))))
+_CUTOFF_RE = re.compile('|'.join(map(re.escape, sorted(_CUTOFF_TERMS))))
+
+# Non-empty lines of the extracted text, matched in place so their offsets are known
+_LINE_RE = re.compile(r'[^\n]+')
+
+# Pages opened by pdfplumber before falling back to the rest of the document
+FIRST_PASS_PAGES = 5
+
+# Phrases that open the jury demand right before the plaintiff's contact block
+_TRIGGER_PHRASES = (
+    "PLAINTIFF HEREBY DEMANDSA JURYTRIAL ON ALL ISSUES SO TRIABLE.",
+    "Plaintiff demands trial by jury on all issues triable as of right."
+)
+
+# Trigger prefixes looked for in the raw file bytes (uncompressed content streams)
+_RAW_TRIGGER_PREFIXES = (b"PLAINTIFF HEREBY DEMANDS", b"Plaintiff demands trial by jury")
+
+def _page_may_have_text(page_obj) -> bool:
     """
-    Extract plaintiff contact info from PDF, returning text with alignment/bbox.
-    Returns a list of dicts with line-by-line layout information.
+    Cheap check on a pdfminer page's resources, without parsing its content.
+    A page with no fonts and no form XObjects (e.g. a scanned exhibit) cannot
+    draw any text.
+    """
+    resources = resolve1(page_obj.resources) or {}
+    if resolve1(resources.get('Font')):
+        return True
+    xobjects = resolve1(resources.get('XObject')) or {}
+    for xobject in xobjects.values():
+        subtype = resolve1(xobject).get('Subtype')
+        if getattr(subtype, 'name', subtype) == 'Form':
+            return True
+    return False
+
+
+def _page_text_streams(page_obj) -> List[PDFStream]:
+    """
+    Return the streams a pdfminer page may draw text from: its content
+    streams and, recursively, the form XObjects in its resources.
+    """
+    contents = resolve1(page_obj.attrs.get('Contents'))
+    refs = contents if isinstance(contents, list) else [contents]
+    streams = [stream for stream in map(resolve1, refs) if isinstance(stream, PDFStream)]
+
+    seen = set()
+    pending = [page_obj.resources]
+    while pending:
+        resources = resolve1(pending.pop()) or {}
+        xobjects = resolve1(resources.get('XObject')) or {}
+        for xobject in map(resolve1, xobjects.values()):
+            if not isinstance(xobject, PDFStream) or id(xobject) in seen:
+                continue
+            seen.add(id(xobject))
+            subtype = xobject.get('Subtype')
+            if getattr(subtype, 'name', subtype) == 'Form':
+                streams.append(xobject)
+                pending.append(xobject.get('Resources'))
+    return streams
+
+
+def _raw_trigger_page(pdf_path: str) -> Optional[int]:
+    """
+    Guess the page holding the jury demand without extracting any text.
+
+    The raw file is memory-mapped and searched for the trigger prefixes, which
+    can only be found in uncompressed streams. On a hit, the pages are walked
+    in order and the first one whose content streams or form XObjects contain
+    a prefix is returned. A trigger drawn from a compressed stream is
+    invisible to the scan, so the hint is dropped as soon as a page comes
+    before the hit with a compressed form XObject, or with a compressed
+    content stream and fonts to draw text with: reading must start at page 0
+    to find the same trigger as a full read.
+
+    A trigger split across several text operators of an uncompressed stream
+    is not seen either; for such a page before the hinted one, the hinted
+    trigger is used instead. This is an accepted difference from a full read.
+
+    Returns None when there is no hint.
     """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            full_text = ""
-            all_chars = []
-            char_to_page = []  # Track which page each character belongs to
-
-            # Collect all characters with their page info
-            for page_idx, page in enumerate(pdf.pages):
-                chars = page.chars
-                if chars:
-                    all_chars.extend(chars)
-                    char_to_page.extend([page_idx] * len(chars))
-                page_text = page.extract_text()
-                if page_text:
-                    full_text += page_text + "\n"
-
-            # Trigger phrases
-            trigger_phrases = [
-                "PLAINTIFF HEREBY DEMANDSA JURYTRIAL ON ALL ISSUES SO TRIABLE.",
-                "Plaintiff demands trial by jury on all issues triable as of right."
-            ]
-            alternative_triggers = []
-            all_triggers = trigger_phrases + alternative_triggers
-
-            # Find trigger by checking line by line
-            trigger_index = -1
-            all_lines = full_text.split('\n')
-            cumulative_length = 0
-            
-            for line in all_lines:
-                # Check exact match first
-                found_exact = False
-                for phrase in all_triggers:
-                    if phrase in line:
-                        trigger_index = cumulative_length + line.find(phrase)
-                        found_exact = True
-                        break
-                
-                if found_exact:
-                    break
-                    
-                # If no exact match, try fuzzy matching
-                normalized_line = normalize_text(line)
-                for phrase in all_triggers:
-                    normalized_phrase = normalize_text(phrase)
-                    similarity = SequenceMatcher(None, normalized_phrase, normalized_line).ratio()
-                    if similarity > 0.8:
-                        print(f"Fuzzy match found: '{line}' matches '{phrase}' with similarity {similarity:.2f}")
-                        trigger_index = cumulative_length
-                        found_exact = True
-                        break
-                
-                if found_exact:
-                    break
-                    
-                # Add line length plus newline character for cumulative position tracking
-                cumulative_length += len(line) + 1
-            
-            if trigger_index == -1:
-                print("No trigger phrases found in document")
+        with open(pdf_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
                 return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if all(mm.find(prefix) == -1 for prefix in _RAW_TRIGGER_PREFIXES):
+                    return None
+
+            f.seek(0)
+            doc = PDFDocument(PDFParser(f))
+
+            for page_idx, page in enumerate(PDFPage.create_pages(doc)):
+                streams = _page_text_streams(page)
+                if any(stream.get_filters() for stream in streams):
+                    if _page_may_have_text(page):
+                        return None
+                    continue
+                data = b''.join(stream.get_rawdata() or b'' for stream in streams)
+                if any(prefix in data for prefix in _RAW_TRIGGER_PREFIXES):
+                    return page_idx
+    except Exception:
+        # Only a hint; the caller reads the document from the start
+        return None
+    return None
+
+
+def _iter_page_texts(pdf_path: str, use_layout: bool = False, start_page: int = 0) -> Iterator[str]:
+    """
+    Yield the text of each page in order, parsing pages only as they are consumed.
+
+    The default backend is pypdfium2 (PDFium's C text extraction). With
+    use_layout=True pdfplumber is used instead, opening the first pages before
+    the rest of the document. Pages before start_page are not read.
+    """
+    if not use_layout:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page_idx in range(start_page, len(pdf)):
+                page = pdf[page_idx]
+                try:
+                    # Image-only pages have no text objects, so skip building a text page
+                    if next(page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_TEXT]), None) is None:
+                        continue
+                    textpage = page.get_textpage()
+                    try:
+                        yield textpage.get_text_range().replace('\r\n', '\n')
+                    finally:
+                        textpage.close()
+                finally:
+                    page.close()
+        finally:
+            pdf.close()
+        return
+
+    # The jury demand is almost always within the first few pages, so only
+    # those are opened first. The rest of the document is opened only if the
+    # caller keeps reading.
+    first_pages = list(range(start_page + 1, start_page + FIRST_PASS_PAGES + 1))
+    with pdfplumber.open(pdf_path, pages=first_pages) as pdf:
+        for page in pdf.pages:
+            if _page_may_have_text(page.page_obj):
+                yield page.extract_text()
+        if len(pdf.pages) < FIRST_PASS_PAGES:
+            return
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start_page + FIRST_PASS_PAGES:]:
+            if _page_may_have_text(page.page_obj):
+                yield page.extract_text()
+
+
+def _read_until_trigger(pdf_path: str, use_layout: bool, start_page: int,
+                        triggers: Sequence[str], first_page_only: bool = False) -> Tuple[str, int]:
+    """
+    Read pages from start_page, checking each one for an exact trigger match,
+    and stop once the trigger and the contact text after it have been read.
+    Returns the text read and the trigger offset in it (-1 if not found).
+
+    With first_page_only, give up (-1) when the first non-empty page read has
+    no exact match, instead of looking for the trigger on later pages.
+    """
+    text_parts = []
+    text_length = 0  # length of "\n".join(text_parts)
+    trigger_index = -1
+
+    with closing(_iter_page_texts(pdf_path, use_layout, start_page)) as page_texts:
+        for page_text in page_texts:
+            if not page_text:
+                continue
+
+            page_start_offset = text_length + 1 if text_parts else 0
+            if trigger_index == -1:
+                for phrase in triggers:
+                    idx = page_text.find(phrase)
+                    if idx != -1:
+                        trigger_index = page_start_offset + idx
+                        break
+                if trigger_index == -1 and first_page_only:
+                    return "", -1
+
+            text_parts.append(page_text)
+            text_length = page_start_offset + len(page_text)
+
+            if trigger_index != -1 and text_length >= trigger_index + 500:
+                break
+
+    return "\n".join(text_parts), trigger_index
 
-            # Get the contact text
-            contact_text = full_text[trigger_index:trigger_index + 500]
-            
-            result = clean_contact(contact_text)
 
-            return result
+def extract_plaintiff_contact_with_layout(pdf_path: str, use_layout: bool = False) -> Optional[List[Dict]]:
+    """
+    Extract plaintiff contact info from PDF, returning text with alignment/bbox.
+    Returns a list of dicts with line-by-line layout information.
 
+    Pass use_layout=True to extract page text with pdfplumber rather than pypdfium2.
+    Results are cached per file, keyed on its modification time and size.
+    """
+    try:
+        stat = os.stat(pdf_path)
+    except OSError as e:
+        print(f"Error: {e}")
+        return None
+
+    try:
+        result = _extract_cached(pdf_path, stat.st_mtime_ns, stat.st_size, use_layout)
     except Exception as e:
+        # Not cached, so a transient failure (e.g. a file still being
+        # written) is retried on the next call
         print(f"Error: {e}")
         return None
+    # Hand out a deep copy so callers cannot modify the cached entry
+    return copy.deepcopy(result)
+
+
+@lru_cache(maxsize=256)
+def _extract_cached(pdf_path: str, mtime_ns: int, size: int, use_layout: bool) -> Optional[List[Dict]]:
+    # mtime_ns and size are only part of the cache key, so a rewritten file
+    # is extracted again. Errors propagate, so lru_cache does not keep them.
+    normalized_triggers = [normalize_text(p) for p in _TRIGGER_PHRASES]
+
+    # fuzz.ratio is bounded by 2*min(len)/(len_a+len_b), so a line can only
+    # score 80 against a trigger between 2/3 and 3/2 of its length
+    trigger_lens = [len(p) for p in normalized_triggers]
+    min_line_len = min(trigger_lens) * 2 / 3
+    max_line_len = max(trigger_lens) * 3 / 2
+
+    # Start at the page the raw bytes point to, if any, and read the whole
+    # document when that page itself does not give an exact match: a match
+    # on a later page could be preceded by one the raw scan could not see
+    start_page = _raw_trigger_page(pdf_path) or 0
+    full_text, trigger_index = _read_until_trigger(pdf_path, use_layout, start_page, _TRIGGER_PHRASES,
+                                                   first_page_only=bool(start_page))
+    if trigger_index == -1 and start_page:
+        full_text, trigger_index = _read_until_trigger(pdf_path, use_layout, 0, _TRIGGER_PHRASES)
+
+    # If no exact match, try fuzzy matching line by line
+    if trigger_index == -1:
+        candidate_lines = []
+        candidate_matches = []
+        for line_match in _LINE_RE.finditer(full_text):
+            line = line_match.group()
+            # Normalization only strips characters, so lines already shorter
+            # than the bound are skipped without normalizing them
+            if len(line) < min_line_len:
+                continue
+
+            normalized_line = normalize_text(line)
+            if min_line_len <= len(normalized_line) <= max_line_len:
+                candidate_lines.append(normalized_line)
+                candidate_matches.append(line_match)
+
+        # Score every candidate line against each trigger in one rapidfuzz
+        # call, then keep the earliest line (and its best trigger). Like the
+        # original SequenceMatcher check (ratio > 0.8), a score of exactly
+        # 80 is not a match; score_cutoff only prunes, as rapidfuzz keeps
+        # scores equal to it. fuzz.ratio (LCS based) never scores a pair
+        # below SequenceMatcher, so a few more lines can pass than before.
+        best = None  # (candidate index, score, trigger index)
+        for phrase_idx, trigger in enumerate(normalized_triggers):
+            for _, score, line_idx in process.extract(trigger, candidate_lines, scorer=fuzz.ratio,
+                                                      score_cutoff=80, limit=None):
+                if score <= 80:
+                    continue
+                if best is None or line_idx < best[0] or (line_idx == best[0] and score > best[1]):
+                    best = (line_idx, score, phrase_idx)
+
+        if best is not None:
+            line_idx, score, phrase_idx = best
+            line_match = candidate_matches[line_idx]
+            print(f"Fuzzy match found: '{line_match.group()}' matches '{_TRIGGER_PHRASES[phrase_idx]}' with similarity {score / 100:.2f}")
+            trigger_index = line_match.start()
+
+    if trigger_index == -1:
+        print("No trigger phrases found in document")
+        return None
+
+    # Get the contact text
+    contact_text = full_text[trigger_index:trigger_index + 500]
+
+    result = clean_contact(contact_text)
+
+    return result
+
 
 def clean_contact(text):
     """
@@ -92,38 +318,26 @@ def clean_contact(text):
     'Explanation', 'PATIENT', 'TRANSACTION', 'HISTORY', 'CHARGES',
     then keep nothing after that line.
     """
-    result = []
-    cutoff_terms = [
-        'attorneys for plaintiff', 'benefits', 'explanation', 
-        'patient', 'transaction', 'history', 'charges'
-    ]
-    remove_terms = [
-        'hereby', 'demands', 'jury', 'trial', 
-        'issues', 'triable', 'respectfully', 'submitted', 'this'
-    ]
-
-    for line in text.split('\n'):
-        line_lower = line.lower()
-        if any(term in line_lower for term in remove_terms):
-            continue  # skip this line entirely
-        if any(term in line_lower for term in cutoff_terms):
-            break  # stop processing anything further
-        result.append(line)
+    lines = text.split('\n')
+    text_lower = text.lower()
 
-    return result
+    removed = {text_lower.count('\n', 0, m.start()) for m in _REMOVE_RE.finditer(text_lower)}
+
+    # Keep nothing from the first cutoff line that is not itself removed
+    end = len(lines)
+    for m in _CUTOFF_RE.finditer(text_lower):
+        line_no = text_lower.count('\n', 0, m.start())
+        if line_no not in removed:
+            end = line_no
+            break
+
+    return [line for line_no, line in enumerate(lines[:end]) if line_no not in removed]
 
 
+@lru_cache(maxsize=2048)
 def normalize_text(text: str) -> str:
-    text = text.lower()
-    
-    # Remove extra whitespace and standardize
-    text = ' '.join(text.split())
-    
-    # Remove common punctuation
-    for char in '.,;:!?()[]{}"\'\\-_':
-        text = text.replace(char, '')
-    
-    return text
+    # Lowercase, remove common punctuation and collapse whitespace in one pass
+    return ' '.join(text.lower().translate(_PUNCT_TABLE).split())
 
 
 
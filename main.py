@@ -4,38 +4,44 @@ Simple main entry point for Replit deployment
 """
 
 import os
-import sys
 import uvicorn
-from pathlib import Path
 
-# Ensure required directories exist
-directories = ['logs', 'outputs', 'temp_individual_pdfs', 'pdfs/orange']
-for directory in directories:
-    Path(directory).mkdir(parents=True, exist_ok=True)
+# Directories the service writes to
+directories = ['logs', 'outputs', 'pdfs/orange']
 
-# Add src to path
-src_path = Path(__file__).parent / 'src'
-sys.path.insert(0, str(src_path))
 
-# Set default port
-port = int(os.environ.get('PORT', 8000))
+def main():
+    """Create the working directories and start the service."""
+    # Only call makedirs for directories that are actually missing
+    for directory in directories:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
-if __name__ == "__main__":
-    # Import the FastAPI app
-    from src.main import app
+    # Set default port
+    port = int(os.environ.get('PORT', 8000))
+
+    # Number of uvicorn worker processes (job status is tracked per worker)
+    workers = int(os.environ.get('WEB_CONCURRENCY', 1))
 
     print("🚀 Starting PDF Extraction Service...")
-    print(f"Server will be available on port {port}")
+    print(f"Server will be available on port {port} with {workers} worker(s)")
     print("Available endpoints:")
     print("  - Health Check: GET /health")
     print("  - Service Info: GET /")
     print("  - PDF Extraction: POST /extract")
     print("  - Individual Extraction: POST /extract-individual")
     print("  - PDF Viewer: POST /view-pdf")
+    print("  - PDF Viewer (GET): GET /view-pdf/{file_path}")
 
+    # The app is passed as an import string so uvicorn can spawn workers
     uvicorn.run(
-        app,
+        "src.main:app",
         host="0.0.0.0",
         port=port,
+        workers=workers,
         log_level="info"
     )
+
+
+if __name__ == "__main__":
+    main()
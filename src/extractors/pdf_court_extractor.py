@@ -11,22 +11,222 @@ Extracts:
 """
 
 import os
-import json
 import csv
+import orjson
 import pdfplumber
-from difflib import SequenceMatcher
-from pdfminer.high_level import extract_text, extract_pages
-from pdfminer.layout import LTTextBox, LTTextLine
-from typing import Dict, List, Any, Optional
+from rapidfuzz import fuzz, process
+from pdfminer.layout import LTContainer, LTItem, LTText, LTTextBox, LTTextLine
+from typing import BinaryIO, Dict, Iterable, List, Any, Optional, Union
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import re
 import argparse
-from ..utils.database_utils import update_document_with_extraction_results
+import threading
+import multiprocessing
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from ..utils.database_utils import update_documents_with_extraction_results
+
+
+# Date formats understood by _parse_date_to_standard
+_RE_MDY = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+_RE_MONTHNAME = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
+    re.IGNORECASE
+)
+_RE_DMY = re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})')
+
+# Field-name indicators checked by _is_date_field and _is_true_incident_date
+_DATE_FIELD_RE = re.compile(
+    'facts_date|incident_date|contract_date|accident_date|date_of_incident|numeric_date'
+    '|advanced_incident_date|contextual_incident_search|fuzzy_incident_date|at_time_pattern'
+    '|subject_incident_date|loss_date|multiple_dates_extractor'
+)
+_INCIDENT_FIELD_RE = re.compile('facts_date|incident_date|accident_date')
+_NON_INCIDENT_FIELD_RE = re.compile('filed_date|filing_date')
+_FILING_DATE_FIELDS = frozenset({'numeric_date', 'multiple_dates_extractor', 'advanced_incident_date'})
+
+# Incident context inside a (lowercased) date string
+_INCIDENT_CONTEXT_RE = re.compile('on or about|occurred on|happened on')
+_FILED_INCIDENT_CONTEXT_RE = re.compile('on or about|occurred on|happened on|incident on')
+_ANY_INCIDENT_CONTEXT_RE = re.compile('on or about|occurred|happened|incident|accident|collision')
+
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Any of the three date formats in one pattern, for strings listing several dates
+_RE_ANY_DATE = re.compile(
+    f'(?P<mdy>{_RE_MDY.pattern})|(?P<monthname>{_RE_MONTHNAME.pattern})|(?P<dmy>{_RE_DMY.pattern})',
+    re.IGNORECASE
+)
+
+
+def _any_date_to_standard(match: re.Match) -> str:
+    """Format a _RE_ANY_DATE match as YYYY-MM-DD, like _parse_date_to_standard"""
+    first = match.re.groupindex[match.lastgroup]
+    month, day, year = match.group(first + 1, first + 2, first + 3)
+    if match.lastgroup == 'monthname':
+        month = _MONTHS[month.lower()]
+    return f"{year}-{month:0>2}-{day:0>2}"
+
+
+# Words near a multi_pattern match that add to its score
+_MULTI_PATTERN_CONTEXT_KEYWORDS = ('incident', 'accident', 'occurred', 'happened', 'facts')
+
+# Leading phrases stripped by _parse_date_to_standard, each at most once and in this order
+_DATE_PREFIX_RE = re.compile(r'(?:on or about\s*)?(?:on\s*)?(?:occurred on\s*)?(?:happened on\s*)?', re.IGNORECASE)
+
+# A bare MM/DD/YYYY date with no context (usually a filing date)
+_RE_PLAIN = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+
+# Known filing dates never taken as incident dates, unless the pattern file
+# gives its own 'filing_date_blacklist'
+_FILING_DATE_BLACKLIST = frozenset({'July 7, 2025', 'July 18, 2025'})
+
+_RE_CASE_NUMBER = re.compile(r'\d{4}-[A-Z]{2}-\d{6}-[A-Z]')
+_RE_EMAIL = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+
+# Deletion table for the punctuation stripped by normalize_text
+_PUNCT_TABLE = str.maketrans('', '', '.,;:!?()[]{}"\'\\-_')
+
+# Phrases that open the jury demand right before the plaintiff's contact block
+_CONTACT_TRIGGERS = (
+    "PLAINTIFF HEREBY DEMANDSA JURYTRIAL ON ALL ISSUES SO TRIABLE.",
+    "Plaintiff demands trial by jury on all issues triable as of right.",
+    "jury demand",
+    "jury trial demanded",
+    "plaintiff demands",
+    "plaintiff hereby demands"
+)
+_CONTACT_TRIGGERS_LOWER = tuple(p.lower() for p in _CONTACT_TRIGGERS)
+
+# Every trigger at once; a search gives the earliest exact trigger in one scan
+_CONTACT_TRIGGER_RE = re.compile('|'.join(map(re.escape, _CONTACT_TRIGGERS_LOWER)))
+
+# clean_contact drops lines containing a remove term and stops at a cutoff term
+_CONTACT_REMOVE_RE = re.compile('|'.join(map(re.escape, (
+    'hereby', 'demands', 'jury', 'trial',
+    'issues', 'triable', 'respectfully', 'submitted', 'this'
+))))
+_CONTACT_CUTOFF_RE = re.compile('|'.join(map(re.escape, (
+    'attorneys for plaintiff', 'benefits', 'explanation',
+    'patient', 'transaction', 'history', 'charges'
+))))
+
+
+# MongoDB updates sent together by extract_batch
+MONGODB_BATCH_SIZE = 100
+
+# Extractors of a worker process, one per patterns file (and its modification
+# time), so patterns are loaded and compiled once per process, not per PDF
+_WORKER_EXTRACTORS: Dict[tuple, 'PDFCourtExtractor'] = {}
+
+# Process pool shared by every batch that does not ask for a worker count,
+# so concurrent jobs do not each start a pool sized to the CPU count
+_SHARED_POOL: Optional[ProcessPoolExecutor] = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+# Worker processes are not forked from this process, which may be running
+# other threads (e.g. the service's event loop and executors): a forked child
+# can inherit a lock one of them held, such as the stdout lock print needs.
+# forkserver is not available on Windows, where spawn is the default anyway.
+_WORKER_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+
+def _worker_run(pdf_path: str, county: Optional[str], patterns_file: Optional[str]) -> Dict[str, Any]:
+    try:
+        patterns_mtime = os.stat(patterns_file).st_mtime_ns if patterns_file else None
+    except OSError:
+        patterns_mtime = None
+    key = (patterns_file, patterns_mtime)
+    extractor = _WORKER_EXTRACTORS.get(key)
+    if extractor is None:
+        extractor = _WORKER_EXTRACTORS[key] = PDFCourtExtractor(patterns_file)
+    return extractor.extract_from_pdf(pdf_path, county)
+
+
+def shared_worker_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by batch extractions, starting it on first use"""
+    global _SHARED_POOL
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = ProcessPoolExecutor(mp_context=_WORKER_MP_CONTEXT)
+        return _SHARED_POOL
+
+
+def shutdown_worker_pool(pool: Optional[ProcessPoolExecutor] = None):
+    """
+    Shut down the shared process pool; the next batch starts a new one
+
+    Args:
+        pool: Only shut the pool down if it is still this one (e.g. a pool
+            found broken by a batch that another batch may have replaced)
+    """
+    global _SHARED_POOL
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None or (pool is not None and pool is not _SHARED_POOL):
+            return
+        old_pool, _SHARED_POOL = _SHARED_POOL, None
+    old_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_pdfs_parallel(pdf_paths: List[str], patterns_file: str = None, county: str = None,
+                          workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run extract_from_pdf over several PDFs in worker processes
+
+    Args:
+        pdf_paths: Paths of the PDFs to extract
+        patterns_file: Path to JSON file containing extraction patterns
+        county: County name
+        workers: Number of worker processes (defaults to the shared pool)
+
+    Returns:
+        Extraction results, in the order of pdf_paths
+    """
+    n = len(pdf_paths)
+    if workers is None:
+        return list(shared_worker_pool().map(_worker_run, pdf_paths, [county] * n, [patterns_file] * n))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_WORKER_MP_CONTEXT) as executor:
+        return list(executor.map(_worker_run, pdf_paths, [county] * n, [patterns_file] * n))
+
+
+# Escapes that match the same characters with or without re.IGNORECASE
+_CASE_NEUTRAL_ESCAPE_RE = re.compile(r'\\[dDsSwWbBAZ]|\\[^0-9A-Za-z]')
+
+
+def _is_case_neutral(regex: str) -> bool:
+    """True if a regex has no letters for re.IGNORECASE to fold, e.g. a numeric date pattern"""
+    return not any(c.isalpha() or c == '\\' for c in _CASE_NEUTRAL_ESCAPE_RE.sub('', regex))
+
+
+def _render_layout_text(item: LTItem, out: List[str]):
+    """Append the text of a pdfminer layout item the way pdfminer's TextConverter writes it"""
+    if isinstance(item, LTContainer):
+        for child in item:
+            _render_layout_text(child, out)
+    elif isinstance(item, LTText):
+        out.append(item.get_text())
+    if isinstance(item, LTTextBox):
+        out.append("\n")
 
 
 class PDFCourtExtractor:
     """Main class for extracting court data from PDFs"""
 
+    # Compiled pattern-file regexes, keyed by (pattern string, flags)
+    _COMPILED: Dict[tuple, re.Pattern] = {}
+
+    # Errors of pattern-file regexes that failed to compile, with the same keys
+    _INVALID: Dict[tuple, re.error] = {}
+
     def __init__(self, patterns_file: str = None):
         """
         Initialize the extractor
@@ -36,39 +236,91 @@ class PDFCourtExtractor:
         """
         self.patterns = {}
         self.county = ""
+        self.patterns_file = None
+        self.filing_date_blacklist = _FILING_DATE_BLACKLIST
         self.extraction_order = []
 
+        # Positional text elements are only used by nearest_word patterns
+        self._needs_positions = False
+
+        # Trigger phrases as compared by the fuzzy contact search
+        self._normalized_triggers = [self.normalize_text(p) for p in _CONTACT_TRIGGERS]
+
+        # Output directories already created by this extractor
+        self._output_dirs = set()
+
         if patterns_file and os.path.exists(patterns_file):
             self.load_patterns(patterns_file)
             
-    def normalize_text(self, text: str) -> str:
-        """
-        Normalize text by converting to lowercase, removing extra whitespace and punctuation.
-        
-        Args:
-            text: The text to normalize
-            
-        Returns:
-            Normalized text string
-        """
-        text = text.lower()
-        
-        # Remove extra whitespace and standardize
-        text = ' '.join(text.split())
-        
-        # Remove common punctuation
-        for char in '.,;:!?()[]{}"\'\\-_':
-            text = text.replace(char, '')
-        
-        return text
-
     def load_patterns(self, patterns_file: str):
         """Load extraction patterns from JSON file"""
-        with open(patterns_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(patterns_file, 'rb') as f:
+            data = orjson.loads(f.read())
             self.patterns = data.get('patterns', {})
             self.county = data.get('county', '')
             self.extraction_order = data.get('extraction_order', list(self.patterns.keys()))
+            self.filing_date_blacklist = frozenset(data.get('filing_date_blacklist', _FILING_DATE_BLACKLIST))
+        self.patterns_file = patterns_file
+
+        self._needs_positions = any(p.get('type') == 'nearest_word' for p in self.patterns.values())
+
+        # Compile every regex in the pattern file once, up front
+        for pattern in self.patterns.values():
+            regexes = [pattern.get('regex'), pattern.get('date_regex')]
+            regexes += pattern.get('target_patterns', [])
+            regexes += pattern.get('date_patterns', [])
+            regexes += [p.get('regex') for p in pattern.get('patterns', [])]
+            for base_pattern in pattern.get('base_patterns', []):
+                regexes += self._fuzzy_variations(base_pattern)
+            for regex in regexes:
+                if regex:
+                    try:
+                        self._compile(regex)
+                    except re.error:
+                        pass  # Invalid patterns are skipped at extraction time
+
+            # Lowercase the keyword lists searched in the lowercased text
+            for key in ('keywords', 'start_keywords', 'end_keywords', 'context_keywords', 'incident_indicators'):
+                self._lower_keywords(pattern, key)
+
+    @staticmethod
+    def _lower_keywords(pattern: Dict[str, Any], key: str) -> List[str]:
+        """Return a pattern's keyword list lowercased, storing it on the pattern as '_<key>_lower'"""
+        lowered = pattern.get(f'_{key}_lower')
+        if lowered is None:
+            lowered = pattern[f'_{key}_lower'] = [keyword.lower() for keyword in pattern.get(key, [])]
+        return lowered
+
+    @classmethod
+    def _compile(cls, regex: str, flags: int = re.IGNORECASE) -> re.Pattern:
+        """Return the compiled pattern for a regex string, compiling it on first use"""
+        key = (regex, flags)
+        compiled = cls._COMPILED.get(key)
+        if compiled is None:
+            # An invalid regex raises its original error again, without recompiling
+            error = cls._INVALID.get(key)
+            if error is not None:
+                raise re.error(error.msg, error.pattern, error.pos)
+            # Case folding costs time on every character and changes nothing
+            # for patterns made only of digits, punctuation and classes like \d
+            if flags & re.IGNORECASE and _is_case_neutral(regex):
+                flags &= ~re.IGNORECASE
+            try:
+                compiled = cls._COMPILED[key] = re.compile(regex, flags)
+            except re.error as e:
+                cls._INVALID[key] = e
+                raise
+        return compiled
+
+    @staticmethod
+    def _fuzzy_variations(base_pattern: str) -> List[str]:
+        """Variations of a fuzzy_date base pattern with different spacing and punctuation"""
+        return [
+            base_pattern,
+            base_pattern.replace('\\s+', '\\s*'),  # Optional spaces
+            base_pattern.replace(',', '[,.]?'),     # Optional comma or period
+            base_pattern.replace(':', '[:\\-\\s]*') # Various separators
+        ]
             
     def normalize_text(self, text: str) -> str:
         """
@@ -80,16 +332,8 @@ class PDFCourtExtractor:
         Returns:
             Normalized text string
         """
-        text = text.lower()
-        
-        # Remove extra whitespace and standardize
-        text = ' '.join(text.split())
-        
-        # Remove common punctuation
-        for char in '.,;:!?()[]{}"\'\\-_':
-            text = text.replace(char, '')
-        
-        return text
+        # Remove common punctuation in one pass, then collapse whitespace
+        return ' '.join(text.lower().translate(_PUNCT_TABLE).split())
         
     def extract_plaintiff_contact(self, pdf_path: str) -> Optional[str]:
         """
@@ -103,79 +347,94 @@ class PDFCourtExtractor:
         """
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                full_text = ""
-                
-                # Extract text from all pages
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
-                
-                # Trigger phrases for finding contact info
-                trigger_phrases = [
-                    "PLAINTIFF HEREBY DEMANDSA JURYTRIAL ON ALL ISSUES SO TRIABLE.",
-                    "Plaintiff demands trial by jury on all issues triable as of right."
-                ]
-                alternative_triggers = [
-                    "jury demand",
-                    "jury trial demanded",
-                    "plaintiff demands",
-                    "plaintiff hereby demands"
-                ]
-                all_triggers = trigger_phrases + alternative_triggers
-                
-                # Find trigger by checking line by line
-                trigger_index = -1
-                all_lines = full_text.split('\n')
-                cumulative_length = 0
-                
-                for line in all_lines:
-                    # Check exact match first
-                    found_exact = False
-                    for phrase in all_triggers:
-                        if phrase.lower() in line.lower():
-                            trigger_index = cumulative_length + line.lower().find(phrase.lower())
-                            found_exact = True
-                            break
-                    
-                    if found_exact:
-                        break
-                        
-                    # If no exact match, try fuzzy matching
-                    normalized_line = self.normalize_text(line)
-                    for phrase in all_triggers:
-                        normalized_phrase = self.normalize_text(phrase)
-                        similarity = SequenceMatcher(None, normalized_phrase, normalized_line).ratio()
-                        if similarity > 0.8:
-                            trigger_index = cumulative_length
-                            found_exact = True
-                            break
-                    
-                    if found_exact:
-                        break
-                        
-                    # Add line length plus newline character for cumulative position tracking
-                    cumulative_length += len(line) + 1
-                
+                # Pages are only extracted as the trigger search consumes them
+                return self.extract_plaintiff_contact_from_pages(page.extract_text() for page in pdf.pages)
+        except Exception as e:
+            print(f"Error extracting plaintiff contact: {str(e)}")
+            return None
+
+    def extract_plaintiff_contact_from_pages(self, page_texts: Iterable[Optional[str]]) -> Optional[str]:
+        """
+        Extract plaintiff contact information from already extracted page texts.
+
+        Args:
+            page_texts: pdfplumber text of each page, in order
+
+        Returns:
+            Extracted plaintiff contact as a single text string, or None if not found
+        """
+        try:
+            text_parts = []
+            text_length = 0  # length of "".join(text_parts)
+            trigger_index = -1
+
+            # Check each page for the trigger, and stop once the trigger and
+            # the contact text after it have been read
+            for page_text in page_texts:
+                if not page_text:
+                    continue
+
                 if trigger_index == -1:
-                    return None
-                
-                # Get the contact text after the trigger
-                contact_text = full_text[trigger_index:trigger_index + 500]
-                
-                # Clean the contact text
-                cleaned_contact = self.clean_contact(contact_text)
-                
-                # Join the cleaned contact lines into a single string
-                if cleaned_contact:
-                    result = "\n".join(cleaned_contact)
-                    return result
-                
+                    # Earliest exact trigger on the page, case-insensitively
+                    match = _CONTACT_TRIGGER_RE.search(page_text.lower())
+                    if match:
+                        trigger_index = text_length + match.start()
+
+                text_parts.append(page_text + "\n")
+                text_length += len(page_text) + 1
+
+                if trigger_index != -1 and text_length >= trigger_index + 500:
+                    break
+
+            full_text = "".join(text_parts)
+
+            # Only fall back to fuzzy matching when no trigger appears verbatim
+            if trigger_index == -1:
+                trigger_index = self._find_fuzzy_contact_trigger(full_text)
+
+            if trigger_index == -1:
                 return None
-                
+
+            # Clean the 500 characters of contact text after the trigger
+            cleaned_contact = self.clean_contact_from(full_text, trigger_index, 500)
+
+            # Join the cleaned contact lines into a single string
+            if cleaned_contact:
+                result = "\n".join(cleaned_contact)
+                return result
+
+            return None
+
         except Exception as e:
             print(f"Error extracting plaintiff contact: {str(e)}")
             return None
+
+    def _find_fuzzy_contact_trigger(self, full_text: str) -> int:
+        """
+        Find a line resembling one of the jury-demand triggers, for documents
+        where no trigger appears verbatim.
+
+        Args:
+            full_text: Text of all pages
+
+        Returns:
+            Offset of the matching line in full_text, or -1 if not found
+        """
+        cumulative_length = 0
+
+        for line in full_text.split('\n'):
+            normalized_line = self.normalize_text(line)
+            # Like the original SequenceMatcher check (ratio > 0.8), a best
+            # score of exactly 80 is not a match
+            match = process.extractOne(normalized_line, self._normalized_triggers,
+                                       scorer=fuzz.ratio, score_cutoff=80)
+            if match and match[1] > 80:
+                return cumulative_length
+
+            # Add line length plus newline character for cumulative position tracking
+            cumulative_length += len(line) + 1
+
+        return -1
     
     def clean_contact(self, text: str) -> List[str]:
         """
@@ -184,63 +443,103 @@ class PDFCourtExtractor:
         Args:
             text: The raw extracted contact text
             
+        Returns:
+            List of cleaned contact text lines
+        """
+        return self.clean_contact_from(text, 0, len(text))
+
+    def clean_contact_from(self, full_text: str, start: int, length: int) -> List[str]:
+        """
+        Clean the contact text full_text[start:start + length] in place, line by
+        line, without copying the window out first.
+
+        Args:
+            full_text: Text holding the contact block
+            start: Offset where the contact text starts
+            length: Maximum number of characters of contact text
+
         Returns:
             List of cleaned contact text lines
         """
         result = []
-        cutoff_terms = [
-            'attorneys for plaintiff', 'benefits', 'explanation', 
-            'patient', 'transaction', 'history', 'charges'
-        ]
-        remove_terms = [
-            'hereby', 'demands', 'jury', 'trial', 
-            'issues', 'triable', 'respectfully', 'submitted', 'this'
-        ]
-        
-        for line in text.split('\n'):
-            line = line.strip()
+        end = min(start + length, len(full_text))
+        pos = start
+
+        while pos <= end:
+            newline = full_text.find('\n', pos, end)
+            line_end = end if newline == -1 else newline
+            line = full_text[pos:line_end].strip()
+            pos = line_end + 1
+
             if not line:
                 continue
-                
+
             line_lower = line.lower()
-            if any(term in line_lower for term in remove_terms):
+            if _CONTACT_REMOVE_RE.search(line_lower):
                 continue  # skip this line entirely
-            if any(term in line_lower for term in cutoff_terms):
+            if _CONTACT_CUTOFF_RE.search(line_lower):
                 break  # stop processing anything further
             result.append(line)
-        
+
         return result
 
-    def extract_text_from_pdf(self, pdf_path: str) -> tuple[str, List[Dict]]:
+    def extract_text_from_pdf(self, pdf_path: Union[str, BinaryIO],
+                              pdf_name: Optional[str] = None) -> tuple[str, Dict[str, List], List[str]]:
         """
-        Extract text and positional elements from PDF
+        Extract text and positional elements from PDF in a single parse
+
+        pdfplumber is opened with default layout analysis, so each page's
+        pdfminer layout gives both the full text (as pdfminer's extract_text
+        would render it) and the positional elements, while pdfplumber's own
+        page text is kept for the plaintiff contact search.
+
+        The positional elements are kept as parallel columns ('text',
+        'text_lower', 'x0', 'y0', 'x1', 'y1', 'page'), one entry per
+        text box or line.
+
+        Args:
+            pdf_path: Path to PDF file, or a binary file object holding it
+            pdf_name: Name used in error messages (default: pdf_path)
 
         Returns:
-            tuple: (full_text, text_elements_with_positions)
+            tuple: (full_text, text_elements_with_positions, page_texts)
         """
-        full_text = ""
-        text_elements = []
+        text_chunks = []
+        text_elements = {key: [] for key in ('text', 'text_lower', 'x0', 'y0', 'x1', 'y1', 'page')}
+        page_texts = []
 
         try:
-            # Extract full text
-            full_text = extract_text(pdf_path)
-
-            # Extract text with positions for advanced matching
-            for page_num, page_layout in enumerate(extract_pages(pdf_path)):
-                for element in page_layout:
-                    if isinstance(element, (LTTextBox, LTTextLine)):
-                        x0, y0, x1, y1 = element.bbox
-                        text = element.get_text().strip()
-                        if text:
-                            text_elements.append({
-                                'text': text,
-                                'x0': x0, 'y0': y0, 'x1': x1, 'y1': y1,
-                                'page': page_num
-                            })
+            with pdfplumber.open(pdf_path, laparams={}) as pdf:
+                for page_num, page in enumerate(pdf.pages):
+                    page_layout = page.layout
+
+                    # Full text, rendered like pdfminer.high_level.extract_text
+                    _render_layout_text(page_layout, text_chunks)
+                    text_chunks.append("\f")
+
+                    # Text with positions for advanced matching, when a pattern uses it
+                    if self._needs_positions:
+                        for element in page_layout:
+                            if isinstance(element, (LTTextBox, LTTextLine)):
+                                x0, y0, x1, y1 = element.bbox
+                                text = element.get_text().strip()
+                                if text:
+                                    text_elements['text'].append(text)
+                                    text_elements['text_lower'].append(text.lower())
+                                    text_elements['x0'].append(x0)
+                                    text_elements['y0'].append(y0)
+                                    text_elements['x1'].append(x1)
+                                    text_elements['y1'].append(y1)
+                                    text_elements['page'].append(page_num)
+
+                    page_texts.append(page.extract_text())
+
+                    # Drop the page's cached layout and objects
+                    page.close()
         except Exception as e:
-            raise Exception(f"Error extracting PDF {pdf_path}: {str(e)}")
+            raise Exception(f"Error extracting PDF {pdf_name or pdf_path}: {str(e)}")
 
-        return full_text, text_elements
+        return "".join(text_chunks), text_elements, page_texts
 
     def extract_from_pdf(self, pdf_path: str, county: str = None) -> Dict[str, Any]:
         """
@@ -256,11 +555,30 @@ class PDFCourtExtractor:
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
+        return self._extract(pdf_path, os.path.basename(pdf_path), county)
+
+    def extract_from_stream(self, stream: BinaryIO, pdf_name: str, county: str = None) -> Dict[str, Any]:
+        """
+        Extract data from a PDF held in memory, without writing it to disk
+
+        Args:
+            stream: Binary file object holding the PDF (e.g. io.BytesIO)
+            pdf_name: File name reported as 'pdf_file' in the result
+            county: County name (optional, will use pattern file county if not provided)
+
+        Returns:
+            Dictionary with extracted data
+        """
+        return self._extract(stream, pdf_name, county)
+
+    def _extract(self, source: Union[str, BinaryIO], pdf_name: str, county: Optional[str]) -> Dict[str, Any]:
         # Use provided county or fall back to pattern file county
         county_name = county or self.county or "unknown"
 
         # Extract text from PDF
-        full_text, text_elements = self.extract_text_from_pdf(pdf_path)
+        full_text, text_elements, page_texts = self.extract_text_from_pdf(
+            source, None if isinstance(source, str) else pdf_name)
+        full_text_lower = full_text.lower()
 
         # Extract emails automatically
         emails = self._extract_emails({}, full_text)
@@ -268,7 +586,7 @@ class PDFCourtExtractor:
         # Extract plaintiff contact information
         plaintiff_contact = None
         try:
-            plaintiff_contact = self.extract_plaintiff_contact(pdf_path)
+            plaintiff_contact = self.extract_plaintiff_contact_from_pages(page_texts)
             if plaintiff_contact:
                 print(f"Successfully extracted plaintiff contact information")
         except Exception as e:
@@ -276,7 +594,7 @@ class PDFCourtExtractor:
 
         # Initialize results
         results = {
-            'pdf_file': os.path.basename(pdf_path),
+            'pdf_file': pdf_name,
             'county': county_name,
             'incident_date': None,
             'incident_end_date': None,
@@ -287,17 +605,25 @@ class PDFCourtExtractor:
             'extracted_data': {}
         }
 
+        # Standard form and incident classification of results['incident_date'],
+        # kept alongside it
+        incident_standard_date = None
+        incident_is_true = False
+        extracted_data = results['extracted_data']
+
         # Extract fields using patterns
         for field_name in self.extraction_order:
             if field_name in self.patterns:
                 pattern = self.patterns[field_name]
-                value = self._extract_field(pattern, full_text, text_elements)
+                value = self._extract_field(pattern, full_text, full_text_lower, text_elements)
 
                 if value:
-                    results['extracted_data'][field_name] = value
+                    extracted_data[field_name] = value
 
                     # Set incident date if this field contains date information
                     if self._is_date_field(field_name):
+                        is_incident = self._is_true_incident_date(field_name, value)
+
                         # Add to all incident dates list
                         standardized_date = self._parse_date_to_standard(value)
                         if standardized_date:
@@ -305,22 +631,21 @@ class PDFCourtExtractor:
                                 'original_date': value,
                                 'standard_date': standardized_date,
                                 'source_field': field_name,
-                                'is_incident': self._is_true_incident_date(field_name, value)
+                                'is_incident': is_incident
                             }
                             results['all_incident_dates'].append(incident_info)
 
                         # Set primary incident date (prioritize true incident dates, then longer dates)
-                        if not results['incident_date']:
-                            results['incident_date'] = value
-                            results['incident_source_field'] = field_name
-                        elif self._is_true_incident_date(field_name, value) and not self._is_true_incident_date(results.get('incident_source_field', ''), results['incident_date']):
-                            # Prefer true incident dates over non-incident dates
-                            results['incident_date'] = value
-                            results['incident_source_field'] = field_name
-                        elif len(value) > len(results['incident_date']) and self._is_true_incident_date(field_name, value) == self._is_true_incident_date(results.get('incident_source_field', ''), results['incident_date']):
-                            # Among dates of same type, prefer longer dates
+                        primary_date = results['incident_date']
+                        if (not primary_date
+                                # Prefer true incident dates over non-incident dates
+                                or (is_incident and not incident_is_true)
+                                # Among dates of same type, prefer longer dates
+                                or (len(value) > len(primary_date) and is_incident == incident_is_true)):
                             results['incident_date'] = value
                             results['incident_source_field'] = field_name
+                            incident_standard_date = standardized_date
+                            incident_is_true = is_incident
 
         # After all extractions, determine earliest and latest incident dates
         true_incident_dates = [
@@ -329,24 +654,28 @@ class PDFCourtExtractor:
         ]
 
         # Also check multiple_dates_extractor for additional dates
-        multiple_dates_str = results.get('extracted_data', {}).get('multiple_dates_extractor', '')
+        multiple_dates_str = extracted_data.get('multiple_dates_extractor', '')
         if multiple_dates_str and multiple_dates_str != 'NA':
             # Parse individual dates from multiple_dates_extractor
+            seen_standard_dates = {d['standard_date'] for d in true_incident_dates}
             parts = multiple_dates_str.split(' | ')
             for part in parts:
                 # Extract just the date part, removing context like "(death)"
                 date_part = part.split(' (')[0].strip()
                 # Skip plain filing dates and common filing date patterns
-                if re.match(r'^\d{2}/\d{2}/\d{4}$', date_part):
+                if _RE_PLAIN.match(date_part):
                     continue
-                # Also skip dates that are likely filing dates (July 7, 2025 or July 18, 2025)
-                if date_part in ['July 7, 2025', 'July 18, 2025']:
+                # Also skip dates that are known filing dates (July 7, 2025 or July 18, 2025 by default)
+                if date_part in self.filing_date_blacklist:
                     continue
-                standard_date = self._parse_date_to_standard(date_part)
-                if standard_date:
+                # Each part holds a single date, so one combined search replaces
+                # the three sequential ones of _parse_date_to_standard
+                date_match = _RE_ANY_DATE.search(date_part)
+                if date_match:
+                    standard_date = _any_date_to_standard(date_match)
                     # Check if this date is already in true_incident_dates
-                    already_exists = any(d['standard_date'] == standard_date for d in true_incident_dates)
-                    if not already_exists:
+                    if standard_date not in seen_standard_dates:
+                        seen_standard_dates.add(standard_date)
                         # Add this as a true incident date
                         true_incident_dates.append({
                             'original_date': part,  # Keep original with context
@@ -356,12 +685,12 @@ class PDFCourtExtractor:
                         })
 
         if true_incident_dates:
-            # Sort by standardized date
-            true_incident_dates.sort(key=lambda x: x['standard_date'])
+            # Sort by standardized date; YYYY-MM-DD strings order like the dates
+            true_incident_dates.sort(key=itemgetter('standard_date'))
 
             # Set primary incident date to earliest
             earliest = true_incident_dates[0]
-            if not results['incident_date'] or earliest['standard_date'] < self._parse_date_to_standard(results['incident_date']):
+            if not results['incident_date'] or earliest['standard_date'] < incident_standard_date:
                 results['incident_date'] = earliest['original_date']
                 results['incident_source_field'] = earliest['source_field']
 
@@ -376,18 +705,14 @@ class PDFCourtExtractor:
 
     def _is_date_field(self, field_name: str) -> bool:
         """Check if field name indicates a date field"""
-        date_indicators = [
-            'facts_date', 'incident_date', 'contract_date', 
-            'accident_date', 'date_of_incident', 'numeric_date',
-            'advanced_incident_date', 'contextual_incident_search',
-            'fuzzy_incident_date', 'at_time_pattern', 'subject_incident_date',
-            'loss_date', 'multiple_dates_extractor'
-        ]
-        return any(indicator in field_name for indicator in date_indicators)
+        return _DATE_FIELD_RE.search(field_name) is not None
 
-    def _parse_date_to_standard(self, date_str: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date_to_standard(date_str: str) -> Optional[str]:
         """
-        Parse various date formats to standard YYYY-MM-DD format
+        Parse various date formats to standard YYYY-MM-DD format (memoized, as
+        the same date string is parsed several times per PDF)
 
         Args:
             date_str: Date string in various formats
@@ -398,28 +723,24 @@ class PDFCourtExtractor:
         if not date_str:
             return None
 
-        # Clean up the date string
+        # Clean up the date string and remove common prefixes
         clean_date = date_str.strip()
+        clean_date = clean_date[_DATE_PREFIX_RE.match(clean_date).end():]
 
-        # Remove common prefixes
-        prefixes = ['on or about', 'on', 'occurred on', 'happened on']
-        for prefix in prefixes:
-            if clean_date.lower().startswith(prefix.lower()):
-                clean_date = clean_date[len(prefix):].strip()
+        month_number = _MONTHS.__getitem__
 
         # Try different date parsing patterns
         date_patterns = [
             # MM/DD/YYYY
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', lambda m: f"{m.group(3)}-{m.group(1):0>2}-{m.group(2):0>2}"),
+            (_RE_MDY, lambda m: f"{m.group(3)}-{m.group(1):0>2}-{m.group(2):0>2}"),
             # Month DD, YYYY (with optional ordinals)
-            (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})', 
-             lambda m: f"{m.group(3)}-{self._month_to_number(m.group(1)):0>2}-{m.group(2):0>2}"),
+            (_RE_MONTHNAME, lambda m: f"{m.group(3)}-{month_number(m.group(1).lower()):0>2}-{m.group(2):0>2}"),
             # DD-MM-YYYY or MM-DD-YYYY
-            (r'(\d{1,2})-(\d{1,2})-(\d{4})', lambda m: f"{m.group(3)}-{m.group(1):0>2}-{m.group(2):0>2}"),
+            (_RE_DMY, lambda m: f"{m.group(3)}-{m.group(1):0>2}-{m.group(2):0>2}"),
         ]
 
         for pattern, formatter in date_patterns:
-            match = re.search(pattern, clean_date, re.IGNORECASE)
+            match = pattern.search(clean_date)
             if match:
                 try:
                     return formatter(match)
@@ -430,32 +751,23 @@ class PDFCourtExtractor:
 
     def _month_to_number(self, month_name: str) -> int:
         """Convert month name to number"""
-        months = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12
-        }
-        return months.get(month_name.lower(), 1)
+        return _MONTHS.get(month_name.lower(), 1)
 
     def _standardize_multiple_dates(self, multiple_dates_str: str) -> str:
         """Convert multiple dates string to standardized format"""
         if not multiple_dates_str or multiple_dates_str == "NA":
             return ""
 
-        dates = []
-        parts = multiple_dates_str.split(' | ')
-        for part in parts:
-            # Extract just the date part, removing context like "(death)"
-            date_part = part.split(' (')[0].strip()
-            standard_date = self._parse_date_to_standard(date_part)
-            if standard_date:
-                dates.append(standard_date)
-
-        return ' | '.join(dates)
+        # One date per part, and the context in parentheses holds no dates,
+        # so a single scan of the whole string finds each part's date in order
+        return ' | '.join(_any_date_to_standard(m) for m in _RE_ANY_DATE.finditer(multiple_dates_str))
 
-    def _is_true_incident_date(self, source_field: str, date_str: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_true_incident_date(source_field: str, date_str: str) -> bool:
         """
         Determine if the extracted date is a true incident date vs other dates (filing, etc.)
+        (memoized, as it is re-evaluated for the same dates while ranking them)
 
         Args:
             source_field: The field name where the date was extracted from
@@ -464,55 +776,40 @@ class PDFCourtExtractor:
         Returns:
             True if this appears to be an actual incident date
         """
-        # True incident date indicators
-        incident_indicators = [
-            'facts_date', 'incident_date', 'accident_date'
-        ]
-
-        # Non-incident date indicators (these are typically filing/administrative dates)
-        non_incident_indicators = [
-            'filed_date', 'filing_date'
-        ]
+        date_lower = date_str.lower()
 
-        # Check if it's clearly a non-incident date
-        if any(indicator in source_field for indicator in non_incident_indicators):
+        # Check if it's clearly a non-incident date (typically filing/administrative dates)
+        if _NON_INCIDENT_FIELD_RE.search(source_field):
             # However, if the date string contains incident context, it might still be an incident date
-            incident_context = ['on or about', 'occurred on', 'happened on', 'incident on']
-            if any(context in date_str.lower() for context in incident_context):
-                return True
-            return False
+            return _FILED_INCIDENT_CONTEXT_RE.search(date_lower) is not None
 
         # Check if it's clearly an incident date
-        if any(indicator in source_field for indicator in incident_indicators):
+        if _INCIDENT_FIELD_RE.search(source_field):
             return True
 
         # If date string contains incident context words, likely an incident date
-        incident_context = ['on or about', 'occurred on', 'happened on']
-        if any(context in date_str.lower() for context in incident_context):
+        if _INCIDENT_CONTEXT_RE.search(date_lower):
             return True
 
-        # Special cases for likely filing dates
-        filing_date_indicators = [
-            'numeric_date', 'multiple_dates_extractor', 'advanced_incident_date'
-        ]
-
         # If it's a pattern that could be filing date and has no incident context, likely filing
-        if (source_field in filing_date_indicators and 
-            not any(context in date_str.lower() for context in ['on or about', 'occurred', 'happened', 'incident', 'accident', 'collision'])):
+        if source_field in _FILING_DATE_FIELDS and not _ANY_INCIDENT_CONTEXT_RE.search(date_lower):
             return False
 
         # Special case: plain numeric dates like "07/07/2025" without context are likely filing dates
-        if re.match(r'^\d{2}/\d{2}/\d{4}$', date_str.strip()):
+        if _RE_PLAIN.match(date_str.strip()):
             return False
 
         # Default to True for ambiguous cases (most court docs are about incidents)
         return True
 
-    def _extract_field(self, pattern: Dict[str, Any], full_text: str, 
-                      text_elements: List[Dict]) -> Optional[str]:
+    def _extract_field(self, pattern: Dict[str, Any], full_text: str, full_text_lower: str,
+                      text_elements: Dict[str, List]) -> Optional[str]:
         """
         Extract field based on pattern type
 
+        full_text_lower is full_text.lower(), computed once per PDF for the
+        keyword searches.
+
         Pattern Types:
         - 'regex': Direct regex pattern matching
         - 'nearest_word': Find text near keywords
@@ -527,17 +824,17 @@ class PDFCourtExtractor:
         elif pattern_type == 'nearest_word':
             return self._extract_nearest_word(pattern, text_elements)
         elif pattern_type == 'section_pattern':
-            return self._extract_section(pattern, full_text)
+            return self._extract_section(pattern, full_text, full_text_lower)
         elif pattern_type == 'facts_pattern':
-            return self._extract_facts_date(pattern, full_text)
+            return self._extract_facts_date(pattern, full_text, full_text_lower)
         elif pattern_type == 'case_title':
             return self._extract_case_title(pattern, full_text)
         elif pattern_type == 'fuzzy_date':
-            return self._extract_fuzzy_date(pattern, full_text)
+            return self._extract_fuzzy_date(pattern, full_text, full_text_lower)
         elif pattern_type == 'contextual_search':
             return self._extract_contextual_search(pattern, full_text)
         elif pattern_type == 'multi_pattern':
-            return self._extract_multi_pattern(pattern, full_text)
+            return self._extract_multi_pattern(pattern, full_text, full_text_lower)
         elif pattern_type == 'multi_date':
             return self._extract_multiple_dates(pattern, full_text)
         elif pattern_type == 'email':
@@ -551,7 +848,7 @@ class PDFCourtExtractor:
         if not regex:
             return None
 
-        match = re.search(regex, full_text, re.IGNORECASE)
+        match = self._compile(regex).search(full_text)
         if match:
             # Always return the full match instead of individual groups
             # This prevents returning just "June" when the full match is "June 17th, 2025"
@@ -569,30 +866,36 @@ class PDFCourtExtractor:
         return None
 
     def _extract_nearest_word(self, pattern: Dict[str, Any], 
-                             text_elements: List[Dict]) -> Optional[str]:
+                             text_elements: Dict[str, List]) -> Optional[str]:
         """Extract text near keywords using positional data"""
-        keywords = pattern.get('keywords', [])
         position = pattern.get('position', 'right')
         max_distance = pattern.get('max_distance', 150)
         extract_words = pattern.get('extract_words', 1)
 
-        for keyword in keywords:
-            for i, elem in enumerate(text_elements):
-                if keyword.lower() in elem['text'].lower():
+        texts = text_elements['text']
+        texts_lower = text_elements['text_lower']
+        xs0 = text_elements['x0']
+        xs1 = text_elements['x1']
+        ys0 = text_elements['y0']
+        pages = text_elements['page']
+        n = len(texts)
+
+        for keyword_lower in self._lower_keywords(pattern, 'keywords'):
+            for i, text_lower in enumerate(texts_lower):
+                if keyword_lower in text_lower:
                     # Found keyword, look for nearby text
                     result_words = []
 
                     if position == 'right':
                         # Look for text to the right
-                        for j in range(i + 1, min(i + 20, len(text_elements))):
-                            next_elem = text_elements[j]
-
+                        page, y0, x1 = pages[i], ys0[i], xs1[i]
+                        for j in range(i + 1, min(i + 20, n)):
                             # Check if on same page and approximately same line
-                            if (next_elem['page'] == elem['page'] and 
-                                abs(next_elem['y0'] - elem['y0']) < 10 and
-                                next_elem['x0'] - elem['x1'] < max_distance):
+                            if (pages[j] == page and
+                                abs(ys0[j] - y0) < 10 and
+                                xs0[j] - x1 < max_distance):
 
-                                result_words.append(next_elem['text'])
+                                result_words.append(texts[j])
                                 if len(result_words) >= extract_words:
                                     break
 
@@ -611,17 +914,14 @@ class PDFCourtExtractor:
 
         return None
 
-    def _extract_section(self, pattern: Dict[str, Any], full_text: str) -> Optional[str]:
+    def _extract_section(self, pattern: Dict[str, Any], full_text: str, full_text_lower: str) -> Optional[str]:
         """Extract text between start and end keywords"""
         start_keywords = pattern.get('start_keywords', [])
-        end_keywords = pattern.get('end_keywords', [])
-
-        text_lower = full_text.lower()
 
         # Find start position
         start_pos = -1
-        for keyword in start_keywords:
-            pos = text_lower.find(keyword.lower())
+        for keyword, keyword_lower in zip(start_keywords, self._lower_keywords(pattern, 'start_keywords')):
+            pos = full_text_lower.find(keyword_lower)
             if pos != -1:
                 start_pos = pos + len(keyword)
                 break
@@ -631,8 +931,8 @@ class PDFCourtExtractor:
 
         # Find end position
         end_pos = len(full_text)
-        for keyword in end_keywords:
-            pos = text_lower.find(keyword.lower(), start_pos)
+        for keyword_lower in self._lower_keywords(pattern, 'end_keywords'):
+            pos = full_text_lower.find(keyword_lower, start_pos)
             if pos != -1 and pos < end_pos:
                 end_pos = pos
 
@@ -641,23 +941,22 @@ class PDFCourtExtractor:
 
         return None
 
-    def _extract_facts_date(self, pattern: Dict[str, Any], full_text: str) -> Optional[str]:
+    def _extract_facts_date(self, pattern: Dict[str, Any], full_text: str, full_text_lower: str) -> Optional[str]:
         """Extract date from facts section using pattern"""
-        keywords = pattern.get('keywords', [])
         date_regex = pattern.get('date_regex', '')
 
         if not date_regex:
             return None
 
-        for keyword in keywords:
-            keyword_pos = full_text.lower().find(keyword.lower())
+        for keyword_lower in self._lower_keywords(pattern, 'keywords'):
+            keyword_pos = full_text_lower.find(keyword_lower)
             if keyword_pos != -1:
                 # Look for date pattern nearby
                 search_start = max(0, keyword_pos - 50)
                 search_end = min(len(full_text), keyword_pos + 200)
                 search_text = full_text[search_start:search_end]
 
-                date_match = re.search(date_regex, search_text, re.IGNORECASE)
+                date_match = self._compile(date_regex).search(search_text)
                 if date_match:
                     return date_match.group(1) if date_match.groups() else date_match.group(0)
 
@@ -683,35 +982,29 @@ class PDFCourtExtractor:
                         # Clean up the line
                         title = line.strip()
                         # Remove case number if present
-                        title = re.sub(r'\d{4}-[A-Z]{2}-\d{6}-[A-Z]', '', title).strip()
+                        title = _RE_CASE_NUMBER.sub('', title).strip()
                         if title and len(title) > 5:
                             return title
 
         return None
 
-    def _extract_fuzzy_date(self, pattern: Dict[str, Any], full_text: str) -> Optional[str]:
+    def _extract_fuzzy_date(self, pattern: Dict[str, Any], full_text: str, full_text_lower: str) -> Optional[str]:
         """
         Extract dates with fuzzy matching - handles variations in spacing, punctuation, etc.
         """
         base_patterns = pattern.get('base_patterns', [])
-        context_keywords = pattern.get('context_keywords', [])
+        context_keywords = self._lower_keywords(pattern, 'context_keywords')
 
         # Create variations of the base patterns
         all_patterns = []
         for base_pattern in base_patterns:
             # Add variations with different spacing and punctuation
-            variations = [
-                base_pattern,
-                base_pattern.replace('\\s+', '\\s*'),  # Optional spaces
-                base_pattern.replace(',', '[,.]?'),     # Optional comma or period
-                base_pattern.replace(':', '[:\\-\\s]*') # Various separators
-            ]
-            all_patterns.extend(variations)
+            all_patterns.extend(self._fuzzy_variations(base_pattern))
 
         # Search near context keywords if provided
         if context_keywords:
-            for keyword in context_keywords:
-                keyword_pos = full_text.lower().find(keyword.lower())
+            for keyword_lower in context_keywords:
+                keyword_pos = full_text_lower.find(keyword_lower)
                 if keyword_pos != -1:
                     # Search in a window around the keyword
                     search_start = max(0, keyword_pos - 200)
@@ -720,7 +1013,7 @@ class PDFCourtExtractor:
 
                     for pattern_regex in all_patterns:
                         try:
-                            match = re.search(pattern_regex, search_text, re.IGNORECASE)
+                            match = self._compile(pattern_regex).search(search_text)
                             if match:
                                 return self._extract_best_match(match)
                         except re.error:
@@ -729,7 +1022,7 @@ class PDFCourtExtractor:
         # Fallback to global search
         for pattern_regex in all_patterns:
             try:
-                match = re.search(pattern_regex, full_text, re.IGNORECASE)
+                match = self._compile(pattern_regex).search(full_text)
                 if match:
                     return self._extract_best_match(match)
             except re.error:
@@ -752,7 +1045,7 @@ class PDFCourtExtractor:
         # Find all potential contexts
         contexts = []
         for primary in primary_keywords:
-            for match in re.finditer(re.escape(primary), full_text, re.IGNORECASE):
+            for match in self._compile(re.escape(primary)).finditer(full_text):
                 start_pos = match.start()
                 contexts.append({
                     'keyword': primary,
@@ -764,17 +1057,18 @@ class PDFCourtExtractor:
         # Score each context
         for context in contexts:
             context_text = full_text[context['context_start']:context['context_end']]
+            context_lower = context_text.lower()
             score = 1  # Base score for primary keyword
 
             # Add points for secondary keywords
             for secondary in secondary_keywords:
-                if secondary.lower() in context_text.lower():
+                if secondary.lower() in context_lower:
                     score += 0.5
 
             # Search for target patterns in this context
             for target_pattern in target_patterns:
                 try:
-                    match = re.search(target_pattern, context_text, re.IGNORECASE)
+                    match = self._compile(target_pattern).search(context_text)
                     if match:
                         if score > best_score:
                             best_score = score
@@ -784,29 +1078,41 @@ class PDFCourtExtractor:
 
         return best_match
 
-    def _extract_multi_pattern(self, pattern: Dict[str, Any], full_text: str) -> Optional[str]:
+    def _extract_multi_pattern(self, pattern: Dict[str, Any], full_text: str, full_text_lower: str) -> Optional[str]:
         """
         Try multiple patterns in priority order and return the best match
         """
         patterns = pattern.get('patterns', [])
-        scoring = pattern.get('scoring', {})
 
         candidates = []
 
+        # Start offsets of each context keyword in the lowercased text, found
+        # once on the first match and then searched per match window. Lowercasing
+        # can change the length of some non-ASCII text; offsets are then not
+        # shared and each window is lowercased as it used to be.
+        keyword_starts = None
+        offsets_shared = len(full_text_lower) == len(full_text)
+
+        # Each pattern scans the text on its own: a single alternation would
+        # drop a pattern's matches that overlap an earlier pattern's, and the
+        # patterns' leading (?i) flags are not allowed inside one
         for i, pattern_info in enumerate(patterns):
             pattern_regex = pattern_info.get('regex', '')
             weight = pattern_info.get('weight', 1.0)
 
             try:
-                matches = list(re.finditer(pattern_regex, full_text, re.IGNORECASE))
+                compiled = self._compile(pattern_regex)
             except re.error:
                 continue  # Skip invalid regex patterns
 
-            for match in matches:
+            # Score based on pattern priority (higher priority = higher score)
+            priority_score = weight * (len(patterns) - i)
+
+            for match in compiled.finditer(full_text):
                 extracted = self._extract_best_match(match)
                 if extracted:
                     # Score based on pattern priority, match quality, and context
-                    score = weight * (len(patterns) - i)  # Higher priority = higher score
+                    score = priority_score
 
                     # Bonus for longer matches (more specific)
                     score += len(extracted) * 0.1
@@ -814,10 +1120,21 @@ class PDFCourtExtractor:
                     # Bonus for incident-related context
                     context_start = max(0, match.start() - 100)
                     context_end = min(len(full_text), match.end() + 100)
-                    context = full_text[context_start:context_end].lower()
-
-                    incident_keywords = ['incident', 'accident', 'occurred', 'happened', 'facts']
-                    context_bonus = sum(0.2 for keyword in incident_keywords if keyword in context)
+                    if offsets_shared:
+                        if keyword_starts is None:
+                            keyword_starts = [
+                                self._substring_starts(full_text_lower, keyword)
+                                for keyword in _MULTI_PATTERN_CONTEXT_KEYWORDS
+                            ]
+                        found = [
+                            self._has_start_between(starts, context_start, context_end - len(keyword))
+                            for keyword, starts in zip(_MULTI_PATTERN_CONTEXT_KEYWORDS, keyword_starts)
+                        ]
+                    else:
+                        context = full_text[context_start:context_end].lower()
+                        found = [keyword in context for keyword in _MULTI_PATTERN_CONTEXT_KEYWORDS]
+
+                    context_bonus = sum(0.2 for keyword_found in found if keyword_found)
                     score += context_bonus
 
                     candidates.append({
@@ -833,14 +1150,36 @@ class PDFCourtExtractor:
 
         return None
 
+    @staticmethod
+    def _substring_starts(text: str, substring: str) -> List[int]:
+        """Sorted start offsets of every (possibly overlapping) occurrence of substring in text"""
+        starts = []
+        pos = text.find(substring)
+        while pos != -1:
+            starts.append(pos)
+            pos = text.find(substring, pos + 1)
+        return starts
+
+    @staticmethod
+    def _has_start_between(starts: List[int], low: int, high: int) -> bool:
+        """True if the sorted offsets hold one in [low, high]"""
+        idx = bisect_left(starts, low)
+        return idx < len(starts) and starts[idx] <= high
+
     def _extract_best_match(self, match) -> str:
         """Extract the best representation from a regex match"""
-        if match.groups():
-            # Find the longest non-empty group
-            groups = [g for g in match.groups() if g]
-            if groups:
-                return max(groups, key=len)
-        return match.group(0)
+        # No group took part in the match (or the pattern has none)
+        if match.lastindex is None:
+            return match.group(0)
+
+        # Find the longest non-empty group, the first one on ties
+        best = None
+        best_len = 0
+        for group in match.groups():
+            if group and len(group) > best_len:
+                best = group
+                best_len = len(group)
+        return best or match.group(0)
 
     def _extract_multiple_dates(self, pattern: Dict[str, Any], full_text: str) -> str:
         """
@@ -849,6 +1188,7 @@ class PDFCourtExtractor:
         date_patterns = pattern.get('date_patterns', [])
         context_radius = pattern.get('context_radius', 50)
         incident_indicators = pattern.get('incident_indicators', [])
+        indicators_lower = self._lower_keywords(pattern, 'incident_indicators')
 
         all_dates = []
         seen_standardized_dates = set()  # Track standardized dates to avoid duplicates
@@ -856,13 +1196,13 @@ class PDFCourtExtractor:
         # Find all dates with their contexts
         for date_pattern in date_patterns:
             try:
-                for match in re.finditer(date_pattern, full_text, re.IGNORECASE):
+                for match in self._compile(date_pattern).finditer(full_text):
                     date_text = match.group(0)
                     start_pos = match.start()
                     end_pos = match.end()
 
                     # Skip filing dates (MM/DD/YYYY format without context)
-                    if re.match(r'^\d{2}/\d{2}/\d{4}$', date_text.strip()):
+                    if _RE_PLAIN.match(date_text.strip()):
                         continue  # Skip plain filing dates
 
                     # Standardize the date to check for duplicates
@@ -879,12 +1219,11 @@ class PDFCourtExtractor:
                     context = full_text[context_start:context_end].lower()
 
                     # Score based on incident indicators in context
-                    incident_score = 0
-                    found_indicators = []
-                    for indicator in incident_indicators:
-                        if indicator.lower() in context:
-                            incident_score += 1
-                            found_indicators.append(indicator)
+                    found_indicators = [
+                        indicator for indicator, indicator_lower in zip(incident_indicators, indicators_lower)
+                        if indicator_lower in context
+                    ]
+                    incident_score = len(found_indicators)
 
                     all_dates.append({
                         'date': date_text,
@@ -920,13 +1259,12 @@ class PDFCourtExtractor:
 
         Returns a comma-separated string of unique email addresses found
         """
-        import re   
-
-        # Standard email regex pattern
-        EMAIL_REGEX = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+        # Every address has an '@'; without one the regex need not scan the text
+        if '@' not in full_text:
+            return None
 
         # Find all email addresses
-        found_emails = EMAIL_REGEX.findall(full_text)
+        found_emails = _RE_EMAIL.findall(full_text)
 
         if found_emails:
             # Remove duplicates and sort
@@ -945,7 +1283,8 @@ class PDFCourtExtractor:
         return None
 
     def extract_batch(self, pdf_folder: str, county: str = None, 
-                     save_individual: bool = True, update_mongodb: bool = True) -> List[Dict[str, Any]]:
+                     save_individual: bool = True, update_mongodb: bool = True,
+                     workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Extract from all PDFs in a folder
 
@@ -954,6 +1293,7 @@ class PDFCourtExtractor:
             county: County name
             save_individual: Whether to save individual results
             update_mongodb: Whether to update MongoDB with extraction results
+            workers: Number of extraction processes (defaults to the CPU count, 1 extracts in this process)
 
         Returns:
             List of extraction results
@@ -961,16 +1301,17 @@ class PDFCourtExtractor:
         if not os.path.exists(pdf_folder):
             raise FileNotFoundError(f"PDF folder not found: {pdf_folder}")
 
-        pdf_files = [f for f in os.listdir(pdf_folder) if f.endswith('.pdf')]
-        results = []
+        with os.scandir(pdf_folder) as entries:
+            pdf_entries = [entry for entry in entries if entry.is_file() and entry.name.lower().endswith('.pdf')]
+        pdf_files = [entry.name for entry in pdf_entries]
 
         # Load PDF to Document ID mapping if it exists
         mapping_file = os.path.join(pdf_folder, "pdf_to_docid_mapping.json")
         pdf_mapping = {}
         if os.path.exists(mapping_file):
             try:
-                with open(mapping_file, 'r', encoding='utf-8') as f:
-                    pdf_mapping = json.load(f)
+                with open(mapping_file, 'rb') as f:
+                    pdf_mapping = orjson.loads(f.read())
                 print(f"Loaded PDF to Document ID mapping with {len(pdf_mapping)} entries")
             except Exception as e:
                 print(f"Warning: Could not load PDF mapping file: {e}")
@@ -978,28 +1319,47 @@ class PDFCourtExtractor:
         print(f"Found {len(pdf_files)} PDF files to process")
         print(f"PDF mapping keys: {list(pdf_mapping.keys())}")
 
-        for pdf_file in pdf_files:
+        # Mapping keys are matched as filename suffixes; indexing them by length
+        # takes one lookup per distinct key length instead of a scan of every key
+        key_order = {key: order for order, key in enumerate(pdf_mapping)}
+        key_lengths = sorted({len(key) for key in pdf_mapping})
+
+        # Extraction is CPU-bound, so the PDFs are parsed in worker processes.
+        # Mapping, MongoDB updates and saving are done here as each PDF
+        # finishes, and the results are returned in file order.
+        file_results = [[] for _ in pdf_files]
+        pending_updates = []
+        executor = None
+        if workers != 1 and len(pdf_files) > 1:
+            # Without an explicit worker count the batch runs on the pool
+            # shared by all jobs, which stays up after the batch
+            executor = shared_worker_pool() if workers is None else ProcessPoolExecutor(
+                max_workers=workers, mp_context=_WORKER_MP_CONTEXT)
+            # Queue the largest PDFs first, so a big file does not start last
+            # and hold up the end of the batch
+            by_size = sorted(range(len(pdf_entries)), key=lambda i: pdf_entries[i].stat().st_size, reverse=True)
+            futures = {
+                executor.submit(_worker_run, os.path.join(pdf_folder, pdf_files[index]), county, self.patterns_file): index
+                for index in by_size
+            }
+            completed = ((futures[future], future) for future in as_completed(futures))
+        else:
+            completed = ((index, None) for index in range(len(pdf_files)))
+
+        for index, future in completed:
+            pdf_file = pdf_files[index]
             pdf_path = os.path.join(pdf_folder, pdf_file)
             print(f"Processing: {pdf_file}")
 
-            try:
-                result = self.extract_from_pdf(pdf_path, county)
-
-                # Find matching entry in PDF mapping (handle filename variations)
-                mapping_key = None
-                mapping_data = None
+            # Find matching entry in PDF mapping (handle filename variations)
+            mapping_key = self._find_mapping_key(pdf_file, key_order, key_lengths)
+            mapping_data = pdf_mapping[mapping_key] if mapping_key is not None else None
 
-                # First try exact match
-                if pdf_file in pdf_mapping:
-                    mapping_key = pdf_file
-                    mapping_data = pdf_mapping[pdf_file]
+            try:
+                if future is not None:
+                    result = future.result()
                 else:
-                    # Try to find a match where the current pdf_file ends with a key from mapping
-                    for key in pdf_mapping:
-                        if pdf_file.endswith(key):
-                            mapping_key = key
-                            mapping_data = pdf_mapping[key]
-                            break
+                    result = self.extract_from_pdf(pdf_path, county)
 
                 # Add MongoDB document ID if available
                 if mapping_data:
@@ -1007,18 +1367,24 @@ class PDFCourtExtractor:
                     result['mongo_doc_id'] = mapping_data['doc_id']
                     result['original_gcs_path'] = mapping_data['original_path']
 
-                results.append(result)
+                file_results[index].append(result)
 
-                # Update MongoDB if enabled and document ID is available
+                # Queue a MongoDB update if enabled and document ID is available
                 if update_mongodb and mapping_data:
-                    print("updating mongodb document with the pdf extracted data")
-                    self._update_mongodb_document(result, mapping_data['doc_id'])
+                    pending_updates.append((mapping_data['doc_id'], result))
+                    if len(pending_updates) >= MONGODB_BATCH_SIZE:
+                        self._update_mongodb_documents(pending_updates)
+                        pending_updates = []
 
                 if save_individual:
                     self._save_individual_result(result)
 
 
             except Exception as e:
+                # A worker died (e.g. killed for memory); replace the shared
+                # pool so later batches do not fail as well
+                if isinstance(e, BrokenProcessPool) and workers is None:
+                    shutdown_worker_pool(executor)
                 print(f"Error processing {pdf_file}: {e}")
                 error_result = {
                     'pdf_file': pdf_file,
@@ -1026,127 +1392,139 @@ class PDFCourtExtractor:
                     'error': str(e)
                 }
 
-                # Find matching entry in PDF mapping for error case too
-                mapping_data = None
-                if pdf_file in pdf_mapping:
-                    mapping_data = pdf_mapping[pdf_file]
-                else:
-                    # Try to find a match where the current pdf_file ends with a key from mapping
-                    for key in pdf_mapping:
-                        if pdf_file.endswith(key):
-                            mapping_data = pdf_mapping[key]
-                            break
-
+                # Use the matching mapping entry for the error case too
                 if mapping_data:
                     error_result['mongo_doc_id'] = mapping_data['doc_id']
 
-                results.append(error_result)
+                file_results[index].append(error_result)
+
+        if executor is not None and workers is not None:
+            executor.shutdown()
+
+        if pending_updates:
+            self._update_mongodb_documents(pending_updates)
+
+        results = [result for entries in file_results for result in entries]
 
         # Save batch results
         self._save_batch_results(results, county or 'batch')
         return results
 
+    @staticmethod
+    def _find_mapping_key(pdf_file: str, key_order: Dict[str, int], key_lengths: List[int]) -> Optional[str]:
+        """
+        Find the PDF mapping key for a file: the filename itself, or else the
+        first key in mapping order that the filename ends with
+
+        Args:
+            pdf_file: PDF filename
+            key_order: Position of each key in the mapping
+            key_lengths: Sorted distinct key lengths
+
+        Returns:
+            Matching mapping key, or None
+        """
+        if pdf_file in key_order:
+            return pdf_file
+
+        suffixes = (pdf_file[len(pdf_file) - length:] for length in key_lengths if length <= len(pdf_file))
+        matches = [suffix for suffix in suffixes if suffix in key_order]
+        return min(matches, key=key_order.__getitem__) if matches else None
+
     def _save_individual_result(self, result: Dict[str, Any]):
         """Save individual extraction result"""
         county_name = result.get('county', 'unknown')
         output_dir = os.path.join('outputs', county_name)
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_output_dir(output_dir)
 
         pdf_name = os.path.splitext(result['pdf_file'])[0]
         output_file = os.path.join(output_dir, f"{pdf_name}.json")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
-    def _update_mongodb_document(self, result: Dict[str, Any], doc_id: str):
-        """Update MongoDB document with extraction results"""
-
-        try:
-            success = update_document_with_extraction_results(doc_id, result)
+    def _ensure_output_dir(self, output_dir: str):
+        """Create an output directory the first time this extractor writes to it"""
+        if output_dir not in self._output_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._output_dirs.add(output_dir)
 
-            if success:
-                print(f"✓ Updated MongoDB document {doc_id} with extraction results")
-            else:
-                print(f"✗ Failed to update MongoDB document {doc_id}")
-
-            return success
-
-        except Exception as e:
-            print(f"Error updating MongoDB document {doc_id}: {e}")
-            return False
+    def _update_mongodb_documents(self, updates: List[tuple]):
+        """Update MongoDB documents with extraction results in one bulk write"""
+        print(f"updating {len(updates)} mongodb documents with the pdf extracted data")
+        modified = update_documents_with_extraction_results(updates)
+        print(f"✓ Updated {modified}/{len(updates)} MongoDB documents with extraction results")
+        return modified
 
     def _save_batch_results(self, results: List[Dict[str, Any]], county: str):
         """Save batch results as JSON and CSV"""
-        os.makedirs('outputs', exist_ok=True)
+        self._ensure_output_dir('outputs')
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
         # Save JSON
         json_file = os.path.join('outputs', f"{county}_batch_{timestamp}.json")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
-        # Save CSV summary
+        # Save CSV summary, written in one pass through a large buffer
         csv_file = os.path.join('outputs', f"{county}_summary_{timestamp}.csv")
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(['PDF File', 'County', 'MongoDB Doc ID', 'Incident Date', 'Incident End Date', 'Standard Incident Date', 'Standard Incident End Date', 'Is Incident', 'All Dates Count', 'Multiple Dates', 'Standard Multiple Dates', 'Emails', 'Status'])
-
-            for result in results:
-                if 'error' in result:
-                    writer.writerow([result['pdf_file'], result['county'], '', '', '', '', '', '', '', '', '', '', f"ERROR: {result['error']}"])
-                else:
-                    original_date = result.get('incident_date', '')
-                    end_date = result.get('incident_end_date', '')
-                    standard_date = self._parse_date_to_standard(original_date) if original_date else ''
-                    standard_end_date = self._parse_date_to_standard(end_date) if end_date else ''
-                    source_field = result.get('incident_source_field', '')
-                    is_incident = self._is_true_incident_date(source_field, original_date) if original_date else False
-
-                    # Check if we only found filing dates (no true incident dates)
-                    all_dates = result.get('all_incident_dates', [])
-                    has_true_incident = any(date_info.get('is_incident', False) for date_info in all_dates)
-
-                    # Additional check: if the primary date is just a plain MM/DD/YYYY with no context, treat as no incident
-                    if original_date and re.match(r'^\d{2}/\d{2}/\d{4}$', original_date.strip()):
-                        has_true_incident = False
-
-                    if not has_true_incident:
-                        original_date = "NA"
-                        end_date = ""
-                        standard_date = "NA"
-                        standard_end_date = ""
-                        is_incident = False
-
-                    # Get multiple dates info
-                    all_dates = result.get('all_incident_dates', [])
-                    dates_count = len(all_dates)
-                    multiple_dates_summary = result.get('extracted_data', {}).get('multiple_dates_extractor', '')
-
-                    # If no true incident dates found, set multiple dates to NA as well
-                    if not has_true_incident:
-                        multiple_dates_summary = "NA"
-
-                    # Create standardized version of multiple dates
-                    standard_multiple_dates = self._standardize_multiple_dates(multiple_dates_summary)
-
-                    # Get emails
-                    emails = result.get('emails', '')
-
-                    writer.writerow([
-                        result['pdf_file'],
-                        result['county'], 
-                        original_date,
-                        end_date,
-                        standard_date,
-                        standard_end_date,
-                        'True' if is_incident else 'False',
-                        dates_count,
-                        multiple_dates_summary[:100] + '...' if len(multiple_dates_summary) > 100 else multiple_dates_summary,
-                        standard_multiple_dates,
-                        emails,
-                        'Success'
-                    ])
+            writer.writerows(self._summary_row(result) for result in results)
 
         print(f"Results saved:")
         print(f"  JSON: {json_file}")
         print(f"  CSV:  {csv_file}")
+
+    def _summary_row(self, result: Dict[str, Any]) -> List[Any]:
+        """Build the CSV summary row of one batch result"""
+        if 'error' in result:
+            return [result['pdf_file'], result['county'], '', '', '', '', '', '', '', '', '', '', f"ERROR: {result['error']}"]
+
+        all_dates = result.get('all_incident_dates', [])
+
+        # Check if we only found filing dates (no true incident dates)
+        has_true_incident = any(date_info.get('is_incident', False) for date_info in all_dates)
+
+        original_date = result.get('incident_date', '')
+
+        # Additional check: if the primary date is just a plain MM/DD/YYYY with no context, treat as no incident
+        if original_date and _RE_PLAIN.match(original_date.strip()):
+            has_true_incident = False
+
+        if has_true_incident:
+            # Date parsing and classification are memoized from the extraction
+            end_date = result.get('incident_end_date', '')
+            standard_date = self._parse_date_to_standard(original_date) if original_date else ''
+            standard_end_date = self._parse_date_to_standard(end_date) if end_date else ''
+            source_field = result.get('incident_source_field', '')
+            is_incident = self._is_true_incident_date(source_field, original_date) if original_date else False
+            extracted_data = result.get('extracted_data')
+            multiple_dates_summary = extracted_data.get('multiple_dates_extractor', '') if extracted_data else ''
+        else:
+            # If no true incident dates found, set the dates and multiple dates to NA
+            original_date = "NA"
+            end_date = ""
+            standard_date = "NA"
+            standard_end_date = ""
+            is_incident = False
+            multiple_dates_summary = "NA"
+
+        # Create standardized version of multiple dates
+        standard_multiple_dates = self._standardize_multiple_dates(multiple_dates_summary)
+
+        return [
+            result['pdf_file'],
+            result['county'],
+            original_date,
+            end_date,
+            standard_date,
+            standard_end_date,
+            'True' if is_incident else 'False',
+            len(all_dates),
+            multiple_dates_summary[:100] + '...' if len(multiple_dates_summary) > 100 else multiple_dates_summary,
+            standard_multiple_dates,
+            result.get('emails', ''),
+            'Success'
+        ]
@@ -7,18 +7,22 @@ Provides endpoints for starting extraction jobs, checking status, and retrieving
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
+import orjson
 import uvicorn
 import os
 from src.models.request_models import PDFRequestModel, IndividualPDFRequestModel
 from src.models.view_models import PDFViewRequestModel
 from src.service.pdf_service import PDFService
 from src.service.pdf_viewer_service import PDFViewerService
+from src.extractors.pdf_court_extractor import shutdown_worker_pool
 from src.utils.logger import setup_logger
 from src.utils.env_loader import load_root_env  # Load environment from root .env
 import asyncio
 import uuid
-from typing import Dict
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
 import sys
 sys.path.append('.')
 
@@ -44,8 +48,40 @@ logger = setup_logger()
 # Initialize PDF viewer service
 pdf_viewer_service = PDFViewerService()
 
-# In-memory store for tracking job status
-job_status: Dict[str, dict] = {}
+# In-memory store for tracking job status, oldest job first. Only the most
+# recent MAX_JOBS jobs are kept.
+MAX_JOBS = 10000
+job_status: OrderedDict[str, dict] = OrderedDict()
+
+
+@app.on_event("shutdown")
+async def shutdown_extraction_workers():
+    """Stop the extraction worker processes shared by all jobs."""
+    shutdown_worker_pool()
+
+
+@app.on_event("shutdown")
+async def close_postgres_connections():
+    """Close the PostgreSQL connection pool used by individual extractions."""
+    from src.service.individual_pdf_service import close_postgres_pool
+    await close_postgres_pool()
+
+
+def _json_response(content) -> Response:
+    """
+    Build a JSON response serialized straight to bytes with orjson.
+    
+    Job status includes the full extraction results, which would otherwise
+    be walked by jsonable_encoder before being encoded.
+    
+    Args:
+        content: JSON-serializable content
+        
+    Returns:
+        Response with the encoded content
+    """
+    return Response(content=orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS),
+                    media_type="application/json")
 
 
 @app.get("/")
@@ -84,6 +120,8 @@ async def extract_pdfs(request: PDFRequestModel, background_tasks: BackgroundTas
         Job information including job_id for status tracking
     """
     job_id = str(uuid.uuid4())
+    date_to = str(request.date_to)
+    date_from = str(request.date_from) if request.date_from else None
     
     # Initialize job status
     job_status[job_id] = {
@@ -91,11 +129,13 @@ async def extract_pdfs(request: PDFRequestModel, background_tasks: BackgroundTas
         "status": "started",
         "county_name": request.county_name,
         "document_type": request.document_type,
-        "date_to": str(request.date_to),
-        "date_from": str(request.date_from) if request.date_from else None,
+        "date_to": date_to,
+        "date_from": date_from,
         "message": "PDF extraction job started",
-        "created_at": str(uuid.uuid4())  # Use timestamp in production
+        "created_at": datetime.now().isoformat()
     }
+    while len(job_status) > MAX_JOBS:
+        job_status.popitem(last=False)
     
     # Add background task
     background_tasks.add_task(
@@ -103,8 +143,8 @@ async def extract_pdfs(request: PDFRequestModel, background_tasks: BackgroundTas
         job_id,
         request.county_name,
         request.document_type,
-        str(request.date_to),
-        str(request.date_from) if request.date_from else None
+        date_to,
+        date_from
     )
     
     logger.info(f"Started PDF extraction job {job_id} for {request.county_name}")
@@ -242,21 +282,26 @@ async def get_job_status(job_id: str):
     Returns:
         Current job status and results
     """
-    if job_id not in job_status:
+    job = job_status.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return job_status[job_id]
+    return _json_response(job)
 
 
 @app.get("/jobs")
-async def list_jobs():
+async def list_jobs(limit: int = 100):
     """
-    List all jobs and their current status.
+    List the most recent jobs and their current status.
     
+    Args:
+        limit: Maximum number of jobs to return (default: 100)
+        
     Returns:
-        Dictionary of all jobs with their status information
+        Dictionary of the most recent jobs with their status information
     """
-    return {"jobs": job_status, "total_jobs": len(job_status)}
+    recent = islice(reversed(job_status), max(limit, 0))
+    return _json_response({"jobs": {job_id: job_status[job_id] for job_id in recent}, "total_jobs": len(job_status)})
 
 
 async def run_pdf_extraction(job_id: str, county_name: str, document_type: str, 
@@ -271,10 +316,13 @@ async def run_pdf_extraction(job_id: str, county_name: str, document_type: str,
         date_to: End date for document filtering
         date_from: Start date for document filtering (optional)
     """
+    # The job may be evicted from job_status while it runs, so keep its entry
+    job = job_status.get(job_id, {})
+
     try:
         # Update status to processing
-        job_status[job_id]["status"] = "processing"
-        job_status[job_id]["message"] = "Downloading and processing PDFs..."
+        job["status"] = "processing"
+        job["message"] = "Downloading and processing PDFs..."
         
         # Initialize PDF service
         pdf_service = PDFService(county_name, document_type, date_to, date_from or "")
@@ -283,17 +331,17 @@ async def run_pdf_extraction(job_id: str, county_name: str, document_type: str,
         result = await pdf_service.run()
         
         # Update status to completed
-        job_status[job_id]["status"] = "completed"
-        job_status[job_id]["message"] = "PDF extraction completed successfully"
-        job_status[job_id]["result"] = result
+        job["status"] = "completed"
+        job["message"] = "PDF extraction completed successfully"
+        job["result"] = result
         
         logger.info(f"Job {job_id} completed successfully")
         
     except Exception as e:
         # Update status to failed
-        job_status[job_id]["status"] = "failed"
-        job_status[job_id]["message"] = f"Error: {str(e)}"
-        job_status[job_id]["error"] = str(e)
+        job["status"] = "failed"
+        job["message"] = f"Error: {str(e)}"
+        job["error"] = str(e)
         
         logger.error(f"Job {job_id} failed: {str(e)}")
 
@@ -302,10 +350,13 @@ def main():
     """Main entry point for the service."""
     # Use port 5000 for Replit, fallback to 8000
     port = int(os.environ.get('PORT', 8000))
+    # Job status is kept in memory, so each worker only sees its own jobs
+    workers = int(os.environ.get('WEB_CONCURRENCY', 1))
     uvicorn.run(
-        app,
+        "src.main:app",
         host="0.0.0.0",
         port=port,
+        workers=workers,
         log_level="info"
     )
 
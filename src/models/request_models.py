@@ -4,9 +4,27 @@ Request Models for PDF Extraction API
 Defines the data models for API requests and responses.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator, model_validator
+from dataclasses import dataclass
 from datetime import date
 from typing import Annotated, Optional, Union
+import re
+
+# A MongoDB ObjectId in its 24-character hex form
+_OBJECT_ID_RE = re.compile(r'[0-9a-fA-F]{24}')
+
+# Request examples shown in the OpenAPI schema
+_PDF_REQUEST_EXAMPLE = {
+    "county_name": "orange",
+    "document_type": "complaint",
+    "date_to": "2024-12-31",
+    "date_from": "2024-01-01"
+}
+_INDIVIDUAL_PDF_REQUEST_EXAMPLE = {
+    "case_id": "507f1f77bcf86cd799439011",
+    "doc_path": "orangecounty/2023/complaints/complaint_12345.pdf",
+    "document_description": "Initial Complaint Document"
+}
 
 
 class PDFRequestModel(BaseModel):
@@ -19,38 +37,27 @@ class PDFRequestModel(BaseModel):
         date_to: End date for document filtering
         date_from: Start date for document filtering (optional)
     """
-    county_name: Annotated[str, Field(min_length=1, description="County name (e.g., 'orange', 'los_angeles')")]
-    document_type: Annotated[str, Field(min_length=1, description="Document type (e.g., 'complaint', 'motion')")]
+    county_name: Annotated[str, StringConstraints(min_length=1, strip_whitespace=True, to_lower=True),
+                           Field(description="County name (e.g., 'orange', 'los_angeles')")]
+    document_type: Annotated[str, StringConstraints(min_length=1, strip_whitespace=True, to_lower=True),
+                             Field(description="Document type (e.g., 'complaint', 'motion')")]
     date_to: Annotated[date, Field(description="End date for document filtering (YYYY-MM-DD)")]
-    date_from: Optional[Annotated[date, Field(description="Start date for document filtering (YYYY-MM-DD)")]] = None
+    date_from: Annotated[Optional[date], Field(description="Start date for document filtering (YYYY-MM-DD)")] = None
 
-    @validator('county_name')
+    @field_validator('county_name')
+    @classmethod
     def validate_county_name(cls, v):
-        """Validate and normalize county name."""
-        return v.lower().strip().replace(' ', '_')
+        """Normalize county name (already lowercased and stripped)."""
+        return v.replace(' ', '_')
     
-    @validator('document_type')
-    def validate_document_type(cls, v):
-        """Validate and normalize document type."""
-        return v.lower().strip()
-    
-    @validator('date_from')
-    def validate_date_range(cls, v, values):
+    @model_validator(mode='after')
+    def validate_date_range(self):
         """Ensure date_from is before date_to if provided."""
-        if v and 'date_to' in values and v > values['date_to']:
+        if self.date_from is not None and self.date_from > self.date_to:
             raise ValueError('date_from must be before date_to')
-        return v
+        return self
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "county_name": "orange",
-                "document_type": "complaint",
-                "date_to": "2024-12-31",
-                "date_from": "2024-01-01"
-            }
-        }
-    }
+    model_config = {"json_schema_extra": {"example": _PDF_REQUEST_EXAMPLE}}
 
 
 class IndividualPDFRequestModel(BaseModel):
@@ -65,51 +72,40 @@ class IndividualPDFRequestModel(BaseModel):
     """
     case_id: Annotated[Union[str, int], Field(description="PostgreSQL case ID (string or integer)")]
     mongo_id: Annotated[Optional[str], Field(description="MongoDB ObjectId (24-character hex string)")] = None
-    doc_path: Annotated[str, Field(min_length=1, description="GCS path to the document")]
+    doc_path: Annotated[str, StringConstraints(min_length=1, strip_whitespace=True),
+                        Field(description="GCS path to the document")]
     document_description: Annotated[str, Field(min_length=1, description="Description of the document")]
 
-    @validator('case_id')
+    @field_validator('case_id')
+    @classmethod
     def validate_case_id(cls, v):
         """Convert case_id to string."""
         return str(v)
 
-    @validator('mongo_id')
+    @field_validator('mongo_id')
+    @classmethod
     def validate_mongo_id(cls, v):
         """Validate MongoDB ObjectId format if provided."""
         if v is None:
             return v
         if len(v) != 24:
             raise ValueError('mongo_id must be a 24-character hex string')
-        try:
-            # Try to create ObjectId to validate format
-            from bson import ObjectId
-            ObjectId(v)
-            return v
-        except Exception:
+        # Hex check in place of constructing a bson.ObjectId
+        if not _OBJECT_ID_RE.fullmatch(v):
             raise ValueError('mongo_id must be a valid ObjectId hex string')
+        return v
 
-    @validator('doc_path')
-    def validate_doc_path(cls, v):
-        """Validate that doc_path looks like a GCS path."""
-        if not v.strip():
-            raise ValueError('doc_path cannot be empty')
-        return v.strip()
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "case_id": "507f1f77bcf86cd799439011",
-                "doc_path": "orangecounty/2023/complaints/complaint_12345.pdf",
-                "document_description": "Initial Complaint Document"
-            }
-        }
-    }
+    model_config = {"json_schema_extra": {"example": _INDIVIDUAL_PDF_REQUEST_EXAMPLE}}
 
 
-class JobStatusResponse(BaseModel):
+@dataclass(slots=True)
+class JobStatusResponse:
     """
     Model for job status response.
     
+    A plain dataclass rather than a Pydantic model: it is only built by the
+    service itself, so there is nothing to validate.
+    
     Attributes:
         job_id: Unique identifier for the job
         status: Current status of the job
@@ -7,8 +7,125 @@ and environment variables.
 
 import os
 import yaml
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Mapping, NamedTuple, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
+
+# Use the libyaml-based loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML files keyed by (absolute path, mtime_ns, size), most recently
+# used last, so an unchanged file is not parsed again by every Config()
+_YAML_CACHE: OrderedDict[Tuple[str, int, int], Any] = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+
+# Environment-derived defaults, read once at import
+_DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+_MONGO_URI = os.getenv("MONGODB_CONNECTION_STRING")
+_GCS_BUCKET = os.getenv("GCS_BUCKET_NAME")
+_GCP_CREDENTIALS_JSON = os.getenv("GCP_CREDENTIALS_JSON")
+
+# Environment variables checked by Config.validate_config
+_REQUIRED_ENV_VARS = ('MONGODB_CONNECTION_STRING', 'GCS_BUCKET_NAME', 'GCP_CREDENTIALS_JSON')
+
+# Default configuration settings, built once at import
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "service": {
+        "name": "PDF Extraction Service",
+        "version": "1.0.0",
+        "host": "0.0.0.0",
+        "port": 8000,
+        "debug": _DEBUG,
+        "reload": True,
+        "workers": 1
+    },
+    "logging": {
+        "level": _LOG_LEVEL,
+        "file_rotation": "1 day",
+        "file_retention": "7 days",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    },
+    "extraction": {
+        "max_concurrent_jobs": 5,
+        "job_timeout_minutes": 30,
+        "patterns_cache_ttl": 3600,
+        "default_date_range_days": 365
+    },
+    "database": {
+        "mongodb": {
+            "uri": _MONGO_URI,
+            "database": "courts-database",
+            "collection": "allcourts",
+            "connection_timeout": 10000
+        },
+        "gcs": {
+            "bucket_name": _GCS_BUCKET,
+            "credentials_json": _GCP_CREDENTIALS_JSON,
+            "download_timeout": 300
+        }
+    },
+    "paths": {
+        "patterns_dir": "patterns",
+        "pdfs_dir": "pdfs", 
+        "outputs_dir": "outputs",
+        "logs_dir": "logs",
+        "temp_dir": "temp"
+    },
+    "defaults": {
+        "county_name": "orange",
+        "document_type": "complaint"
+    }
+}
+
+
+def _load_yaml(path: str) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML document (shared between callers, do not modify)
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key in _YAML_CACHE:
+        _YAML_CACHE.move_to_end(key)
+        return _YAML_CACHE[key]
+
+    with open(path, 'r', encoding='utf-8') as file:
+        document = yaml.load(file, Loader=_YAML_LOADER)
+    _YAML_CACHE[key] = document
+    if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return document
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return a read-only copy of a loaded settings value: dictionaries become
+    MappingProxyType views of frozen copies and lists become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _ConfigSnapshot(NamedTuple):
+    """Settings of one load, with the lookups derived from them"""
+    settings: Mapping[str, Any]
+    flat: Dict[str, Any]
+    service: Mapping[str, Any]
+    logging: Mapping[str, Any]
+    database: Mapping[str, Any]
+    paths: Mapping[str, Any]
+
 
 class Config:
     """
@@ -26,7 +143,52 @@ class Config:
             config_file: Path to the YAML configuration file
         """
         self.config_file = config_file
-        self.settings = self.load_config()
+        self._snapshot = self._build_snapshot(self.load_config())
+
+    @property
+    def settings(self) -> Mapping[str, Any]:
+        """Read-only view of all configuration settings."""
+        return self._snapshot.settings
+
+    def reload(self) -> None:
+        """
+        Load the configuration file again.
+        
+        The new settings replace the old ones in a single assignment, so
+        concurrent readers see either the old or the new settings, never a mix.
+        """
+        self._snapshot = self._build_snapshot(self.load_config())
+
+    def _build_snapshot(self, settings: Dict[str, Any]) -> _ConfigSnapshot:
+        """
+        Build the read-only snapshot of loaded settings.
+        
+        The settings are frozen recursively into a copy, since the merged
+        dictionary shares nested values with the defaults and the YAML cache.
+        
+        Args:
+            settings: Loaded settings
+            
+        Returns:
+            Snapshot with the flattened keys and section views
+        """
+        settings = _freeze(settings)
+
+        # Every value in settings keyed by its dotted path, for Config.get
+        flat = self._flatten(settings)
+
+        def section(name: str) -> Mapping[str, Any]:
+            value = flat.get(name)
+            return value if isinstance(value, Mapping) else MappingProxyType({})
+
+        return _ConfigSnapshot(
+            settings=settings,
+            flat=flat,
+            service=section('service'),
+            logging=section('logging'),
+            database=section('database'),
+            paths=section('paths'),
+        )
 
     def load_config(self) -> Dict[str, Any]:
         """
@@ -40,11 +202,10 @@ class Config:
             return self._get_default_config()
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                # Merge with defaults to ensure all keys exist
-                defaults = self._get_default_config()
-                return self._deep_merge(defaults, config)
+            config = _load_yaml(self.config_file)
+            # Merge with defaults to ensure all keys exist
+            defaults = self._get_default_config()
+            return self._deep_merge(defaults, config)
         except Exception as e:
             print(f"Error loading config from {self.config_file}: {e}")
             print("Using default configuration")
@@ -54,61 +215,21 @@ class Config:
         """
         Return default configuration settings.
         
+        The same dictionary is returned on every call, so it must not be
+        modified; _deep_merge copies the parts it overrides.
+        
         Returns:
             Dictionary with default configuration values
         """
-        return {
-            "service": {
-                "name": "PDF Extraction Service",
-                "version": "1.0.0",
-                "host": "0.0.0.0",
-                "port": 8000,
-                "debug": os.getenv("DEBUG", "false").lower() == "true",
-                "reload": True,
-                "workers": 1
-            },
-            "logging": {
-                "level": os.getenv("LOG_LEVEL", "INFO"),
-                "file_rotation": "1 day",
-                "file_retention": "7 days",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            },
-            "extraction": {
-                "max_concurrent_jobs": 5,
-                "job_timeout_minutes": 30,
-                "patterns_cache_ttl": 3600,
-                "default_date_range_days": 365
-            },
-            "database": {
-                "mongodb": {
-                    "uri": os.getenv("MONGODB_CONNECTION_STRING"),
-                    "database": "courts-database",
-                    "collection": "allcourts",
-                    "connection_timeout": 10000
-                },
-                "gcs": {
-                    "bucket_name": os.getenv("GCS_BUCKET_NAME"),
-                    "credentials_json": os.getenv("GCP_CREDENTIALS_JSON"),
-                    "download_timeout": 300
-                }
-            },
-            "paths": {
-                "patterns_dir": "patterns",
-                "pdfs_dir": "pdfs", 
-                "outputs_dir": "outputs",
-                "logs_dir": "logs",
-                "temp_dir": "temp"
-            },
-            "defaults": {
-                "county_name": "orange",
-                "document_type": "complaint"
-            }
-        }
+        return _DEFAULT_CONFIG
 
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge two dictionaries.
         
+        Neither input is modified: only the nested dictionaries present in
+        both are copied, everything else is shared with base or override.
+        
         Args:
             base: Base dictionary
             override: Override dictionary
@@ -117,13 +238,48 @@ class Config:
             Merged dictionary
         """
         result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        pending = [(result, override)]
+        while pending:
+            merged, overrides = pending.pop()
+            nested = []
+            flat = {}
+            for key, value in overrides.items():
+                current = merged.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    nested.append((key, current, value))
+                else:
+                    flat[key] = value
+            merged.update(flat)
+            for key, current, value in nested:
+                merged[key] = current = current.copy()
+                pending.append((current, value))
         return result
 
+    def _flatten(self, settings: Mapping[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """
+        Map the dotted path of every value in settings to the value.
+        
+        Nested dictionaries are included under their own path as well as
+        their contents, so 'service' and 'service.port' are both keys.
+        
+        Args:
+            settings: Settings dictionary
+            prefix: Dotted path of settings, including the trailing dot
+            
+        Returns:
+            Flat dictionary of dotted paths to values
+        """
+        flat = {}
+        for key, value in settings.items():
+            # Keys that a dotted path cannot name are left out
+            if not isinstance(key, str) or '.' in key:
+                continue
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, Mapping):
+                flat.update(self._flatten(value, path + '.'))
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by key (supports dot notation).
@@ -135,31 +291,23 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self.settings
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
-
-    def get_service_config(self) -> Dict[str, Any]:
-        """Get service-specific configuration."""
-        return self.get('service', {})
+        return self._snapshot.flat.get(key, default)
+
+    def get_service_config(self) -> Mapping[str, Any]:
+        """Get service-specific configuration (read-only)."""
+        return self._snapshot.service
     
-    def get_logging_config(self) -> Dict[str, Any]:
-        """Get logging configuration."""
-        return self.get('logging', {})
+    def get_logging_config(self) -> Mapping[str, Any]:
+        """Get logging configuration (read-only)."""
+        return self._snapshot.logging
     
-    def get_database_config(self) -> Dict[str, Any]:
-        """Get database configuration."""
-        return self.get('database', {})
+    def get_database_config(self) -> Mapping[str, Any]:
+        """Get database configuration (read-only)."""
+        return self._snapshot.database
     
-    def get_paths_config(self) -> Dict[str, Any]:
-        """Get paths configuration."""
-        return self.get('paths', {})
+    def get_paths_config(self) -> Mapping[str, Any]:
+        """Get paths configuration (read-only)."""
+        return self._snapshot.paths
     
     def ensure_directories(self) -> None:
         """Create necessary directories if they don't exist."""
@@ -175,12 +323,8 @@ class Config:
         Returns:
             True if configuration is valid, False otherwise
         """
-        required_env_vars = ['MONGODB_CONNECTION_STRING', 'GCS_BUCKET_NAME', 'GCP_CREDENTIALS_JSON']
-        missing_vars = []
-        
-        for var in required_env_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        # Set but empty counts as missing
+        missing_vars = [var for var in _REQUIRED_ENV_VARS if not os.environ.get(var)]
         
         if missing_vars:
             print(f"Missing required environment variables: {', '.join(missing_vars)}")
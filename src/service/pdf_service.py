@@ -101,7 +101,7 @@ class PDFService:
             
             # Verify download results
             if os.path.exists(self.pdf_folder):
-                pdf_files = [f for f in os.listdir(self.pdf_folder) if f.endswith('.pdf')]
+                pdf_files = [f for f in os.listdir(self.pdf_folder) if f.lower().endswith('.pdf')]
                 self.logger.info(f"PDF download completed. Found {len(pdf_files)} PDF files in {self.pdf_folder}")
             else:
                 self.logger.warning(f"PDF download completed but no folder created at {self.pdf_folder}")
@@ -130,7 +130,7 @@ class PDFService:
                 self.logger.info(f"Created PDF folder: {self.pdf_folder}")
             
             # Check for PDF files
-            pdf_files = [f for f in os.listdir(self.pdf_folder) if f.endswith('.pdf')]
+            pdf_files = [f for f in os.listdir(self.pdf_folder) if f.lower().endswith('.pdf')]
             
             if not pdf_files:
                 return self._create_empty_result(f"No PDF files found in {self.pdf_folder}")
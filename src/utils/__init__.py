@@ -11,9 +11,11 @@ from .database_utils import (
     get_mongo_client,
     find_many,
     update_document_with_extraction_results,
+    update_documents_with_extraction_results,
     download_pdfs_from_gcp,
     get_gcs_client,
     download_file,
+    download_bytes,
     print_header
 )
 from .logger import setup_logger
@@ -22,9 +24,11 @@ __all__ = [
     'get_mongo_client',
     'find_many', 
     'update_document_with_extraction_results',
+    'update_documents_with_extraction_results',
     'download_pdfs_from_gcp',
     'get_gcs_client',
     'download_file',
+    'download_bytes',
     'print_header',
     'setup_logger'
 ]
\ No newline at end of file
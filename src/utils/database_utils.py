@@ -9,12 +9,13 @@ This module provides utilities for:
 
 import os
 import json
+import threading
 from pathlib import Path
 from pymongo import MongoClient
 from google.cloud.exceptions import NotFound, GoogleCloudError
 from google.cloud import storage
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 import re
 
 # Load environment from root .env file
@@ -22,6 +23,10 @@ from .env_loader import load_root_env
 
 load_root_env()  # This will ensure MONGODB_CONNECTION_STRING is available
 
+# GCS clients are built once per thread (downloads run in executor threads)
+# and reused, keyed by the credentials they were built from
+_GCS_CLIENTS = threading.local()
+
 
 def print_header(text: str):
     """Print a formatted header"""
@@ -33,7 +38,8 @@ def print_header(text: str):
 def get_gcs_client():
     """
     Creates and returns a GCS client using credentials from an environment variable
-    containing JSON credentials (not a file path).
+    containing JSON credentials (not a file path). The client is cached per
+    thread, so its credentials and HTTP session are reused by later calls.
 
     Returns:
         storage.Client: Configured GCS client.
@@ -45,12 +51,18 @@ def get_gcs_client():
     if not json_str:
         raise ValueError("Missing GCP_CREDENTIALS_JSON environment variable. Set it to the JSON credentials string.")
 
+    cached = getattr(_GCS_CLIENTS, 'entry', None)
+    if cached is not None and cached[0] == json_str:
+        return cached[1]
+
     try:
         credentials_info = json.loads(json_str)
     except json.JSONDecodeError as e:
         raise ValueError("Invalid JSON in GCP_CREDENTIALS_JSON environment variable.") from e
 
-    return storage.Client.from_service_account_info(credentials_info)
+    client = storage.Client.from_service_account_info(credentials_info)
+    _GCS_CLIENTS.entry = (json_str, client)
+    return client
 
 
 def download_file(key, local_path, bucket_name=None):
@@ -83,6 +95,36 @@ def download_file(key, local_path, bucket_name=None):
         raise GoogleCloudError(f"Failed to download file {key} from GCS bucket {bucket_name}: {str(e)}")
 
 
+def download_bytes(key, bucket_name=None):
+    """
+    Downloads a file from the specified key in the GCS bucket into memory.
+
+    Args:
+        key (str): The key (path) in the GCS bucket.
+        bucket_name (str): The GCS bucket name (default: from environment variable).
+
+    Returns:
+        bytes: The file contents.
+
+    Raises:
+        ValueError: If the GCS bucket name is not set.
+        NotFound: If the file is not found in the GCS bucket.
+        GoogleCloudError: If there's an error downloading from GCS.
+    """
+    if bucket_name is None:
+        bucket_name = os.getenv("GCS_BUCKET_NAME")
+    if not bucket_name:
+        raise ValueError("Missing GCS bucket name in environment variables.")
+
+    client = get_gcs_client()
+    try:
+        return client.bucket(bucket_name).blob(key).download_as_bytes()
+    except NotFound:
+        raise NotFound(f"File not found in GCS bucket {bucket_name}: {key}")
+    except GoogleCloudError as e:
+        raise GoogleCloudError(f"Failed to download file {key} from GCS bucket {bucket_name}: {str(e)}")
+
+
 def get_mongo_client():
     """
     Creates and returns a MongoDB client using credentials from environment variables.
@@ -155,17 +197,9 @@ def update_document_with_extraction_results(doc_id, extraction_results, db_name=
         for doc in document.get("documents", []):
             if doc.get("doc_path") == doc_path:
                 # Update incident dates and emails
-                update_data = {
-                    "$set": {
-                        f"documents.$.incident_date": extraction_results.get("incident_date"),
-                        f"documents.$.incident_end_date": extraction_results.get("incident_end_date"),
-                        f"documents.$.emails": extraction_results.get("emails"),
-                        f"documents.$.plaintiff_contact": extraction_results.get("plaintiff_contact")
-                    }
-                }
                 result = collection.update_one(
                     {"_id": oid, "documents.doc_path": doc_path},
-                    update_data
+                    _extraction_update(extraction_results)
                 )
                 return result.modified_count > 0
 
@@ -180,6 +214,70 @@ def update_document_with_extraction_results(doc_id, extraction_results, db_name=
             client.close()
 
 
+def update_documents_with_extraction_results(updates, db_name='courts-database', collection_name="allcourts"):
+    """
+    Updates several MongoDB documents with PDF extraction results in one bulk write.
+
+    Each update targets the entry of the document's documents array whose
+    doc_path is the result's original_gcs_path; documents or entries that do
+    not exist are left untouched.
+
+    Args:
+        updates (list): (doc_id, extraction_results) pairs.
+        db_name (str): The database name.
+        collection_name (str): The collection name (default: "allcourts").
+
+    Returns:
+        int: Number of documents modified.
+    """
+    from bson import ObjectId
+    from pymongo import UpdateOne
+
+    operations = []
+    for doc_id, extraction_results in updates:
+        doc_path = extraction_results.get("original_gcs_path")
+        if not doc_path:
+            print(f"No doc_path in extraction_results for document {doc_id}")
+            continue
+        try:
+            oid = ObjectId(doc_id)
+        except Exception as e:
+            print(f"Error updating document {doc_id}: {e}")
+            continue
+        operations.append(UpdateOne(
+            {"_id": oid, "documents.doc_path": doc_path},
+            _extraction_update(extraction_results)
+        ))
+
+    if not operations:
+        return 0
+
+    client = None
+    try:
+        client = get_mongo_client()
+        collection = client[db_name][collection_name]
+        result = collection.bulk_write(operations, ordered=False)
+        return result.modified_count
+    except Exception as e:
+        print(f"Error updating {len(operations)} documents: {e}")
+        return 0
+    finally:
+        if client:
+            client.close()
+
+
+def _extraction_update(extraction_results):
+    """Build the $set update of a documents array entry from extraction results"""
+    return {
+        "$set": {
+            "documents.$.incident_date": extraction_results.get("incident_date"),
+            "documents.$.incident_end_date": extraction_results.get("incident_end_date"),
+            "documents.$.emails": extraction_results.get("emails"),
+            "documents.$.plaintiff_contact": extraction_results.get("plaintiff_contact")
+        }
+    }
+
+
 def download_pdfs_from_gcp(county_name, document_type, date_to, date_from=None):
     """
     Download PDFs from GCP bucket to the local 'pdfs' folder.
@@ -204,9 +302,9 @@ def download_pdfs_from_gcp(county_name, document_type, date_to, date_from=None):
 
     # If date_from is not provided, use a default date (e.g., 1 year ago)
     if date_from is None:
-        date_to_obj = datetime.strptime(date_to, "%Y-%m-%d")
+        date_to_obj = date.fromisoformat(date_to)
         date_from_obj = date_to_obj - timedelta(days=365)  # 1 year before date_to
-        date_from = date_from_obj.strftime("%Y-%m-%d")
+        date_from = date_from_obj.isoformat()
 
     print(f"  Date From: {date_from}")
 
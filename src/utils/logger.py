@@ -1,10 +1,15 @@
 from loguru import logger
 import sys
 import os
+from functools import lru_cache
 
+@lru_cache(maxsize=1)
 def setup_logger():
     """
     Setup and configure the logger
+
+    Handlers are added on the first call only; later calls return the same
+    logger instead of replacing them (and opening another log file).
     """
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)